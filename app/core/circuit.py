@@ -0,0 +1,88 @@
+import time
+import logging
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable
+
+from app.core.exceptions import LLMServiceError
+
+logger = logging.getLogger(__name__)
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Per-key circuit breaker for outbound service calls
+
+    Tracks consecutive failures per key (e.g. per LLM provider). After
+    failure_threshold consecutive failures the circuit opens and calls are
+    rejected immediately, so a provider outage costs O(threshold) wasted
+    calls instead of max_attempts retries for every queued job. After
+    recovery_timeout seconds one probe call is allowed (half-open); its
+    outcome closes or re-opens the circuit.
+    """
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._states: Dict[Hashable, CircuitState] = {}
+        self._failure_counts: Dict[Hashable, int] = {}
+        self._opened_at: Dict[Hashable, float] = {}
+
+    def get_state(self, key: Hashable) -> CircuitState:
+        """Get current circuit state for a key, applying recovery transitions"""
+        state = self._states.get(key, CircuitState.CLOSED)
+
+        if state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at[key] > self.recovery_timeout:
+                self._states[key] = CircuitState.HALF_OPEN
+                return CircuitState.HALF_OPEN
+
+        return state
+
+    def allow_request(self, key: Hashable) -> bool:
+        """Check whether a call for this key may proceed"""
+        return self.get_state(key) != CircuitState.OPEN
+
+    def record_success(self, key: Hashable) -> None:
+        """Record a successful call, closing the circuit"""
+        self._states[key] = CircuitState.CLOSED
+        self._failure_counts[key] = 0
+
+    def record_failure(self, key: Hashable) -> None:
+        """Record a failed call, opening the circuit at the threshold"""
+        state = self._states.get(key, CircuitState.CLOSED)
+
+        if state == CircuitState.HALF_OPEN:
+            # Probe call failed - go straight back to open
+            self._open(key)
+            return
+
+        self._failure_counts[key] = self._failure_counts.get(key, 0) + 1
+        if self._failure_counts[key] >= self.failure_threshold:
+            self._open(key)
+
+    def _open(self, key: Hashable) -> None:
+        self._states[key] = CircuitState.OPEN
+        self._opened_at[key] = time.monotonic()
+        logger.warning(f"Circuit breaker opened for {key}")
+
+    async def call(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """Call an async function through the breaker for the given key"""
+        if not self.allow_request(key):
+            raise LLMServiceError(
+                f"Circuit breaker open for {key}",
+                {"circuit_state": CircuitState.OPEN.value}
+            )
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self.record_failure(key)
+            raise
+
+        self.record_success(key)
+        return result
+
+# Shared breaker for LLM provider calls, keyed by LLMProvider
+llm_circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
@@ -1,4 +1,4 @@
-import os
+from pathlib import Path
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -6,16 +6,27 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = True
-    
-    # API Keys
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+
+    # API Keys - resolved by pydantic-settings from env/.env at
+    # instantiation; never capture these into module-level constants
+    # downstream, always read settings.* at call time
+    OPENAI_API_KEY: str = ""
+    GEMINI_API_KEY: str = ""
     
     # File upload settings
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
-    UPLOAD_DIR: str = "uploads"
-    ALLOWED_EXTENSIONS: list = [".pdf", ".docx", ".txt"]
+    UPLOAD_DIR: Path = Path("uploads")
+    # frozenset gives O(1) membership checks on the per-upload hot path
+    ALLOWED_EXTENSIONS: frozenset = frozenset({".pdf", ".docx", ".txt"})
     
+    # Evaluation job settings
+    MAX_JOBS: int = 1000
+    JOB_SWEEP_INTERVAL_S: int = 300
+    MAX_QUEUED_JOBS: int = 1000
+    EVALUATION_WORKERS: int = 4
+    MAX_CONCURRENT_LLM: int = 8
+    EVALUATION_DEADLINE_S: int = 120
+
     # Vector DB settings
     CHROMA_PERSIST_DIR: str = "chroma_db"
     
@@ -23,6 +34,13 @@ class Settings(BaseSettings):
     DEFAULT_LLM_PROVIDER: str = "openai"  # or "gemini" or "mock"
     OPENAI_MODEL: str = "gpt-3.5-turbo"
     GEMINI_MODEL: str = "gemini-pro"
+
+    # LLM response cache: exact tier is always on; the semantic tier reuses
+    # answers for near-identical prompts and is opt-in since it trades
+    # exactness for hit rate
+    LLM_CACHE_SIZE: int = 256
+    LLM_SEMANTIC_CACHE: bool = False
+    LLM_SEMANTIC_CACHE_THRESHOLD: float = 0.97
     
     class Config:
         env_file = ".env"
@@ -1,37 +1,52 @@
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 import logging
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured once at app startup (main.py); importing this
+# module must not touch the root logger as a side effect
 logger = logging.getLogger(__name__)
 
+# Shared read-only default so exceptions raised without details (the common
+# case, e.g. every retry attempt) don't allocate a fresh dict per instance
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 class EvaluationError(Exception):
     """Base exception for evaluation-related errors"""
+    __slots__ = ('message', 'details')
+
     def __init__(self, message: str, details: Dict[str, Any] = None):
         self.message = message
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY_DETAILS
         super().__init__(self.message)
 
 class FileProcessingError(EvaluationError):
     """Exception raised when file processing fails"""
-    pass
+    __slots__ = ()
 
 class LLMServiceError(EvaluationError):
     """Exception raised when LLM service fails"""
-    pass
+    __slots__ = ()
+
+class TransientLLMError(LLMServiceError):
+    """LLM failure that is worth retrying (timeouts, 5xx, network blips)"""
+    __slots__ = ()
+
+class RateLimitError(LLMServiceError):
+    """LLM provider rate limit (HTTP 429); retryable after backoff"""
+    __slots__ = ()
 
 class VectorDatabaseError(EvaluationError):
     """Exception raised when vector database operations fail"""
-    pass
+    __slots__ = ()
 
 class ValidationError(EvaluationError):
     """Exception raised when input validation fails"""
-    pass
+    __slots__ = ()
 
 # Global exception handlers
-async def evaluation_exception_handler(request: Request, exc: EvaluationError):
+def evaluation_exception_handler(request: Request, exc: EvaluationError):
     """Handle custom evaluation exceptions"""
     logger.error(f"Evaluation error: {exc.message}", extra={"details": exc.details})
     
@@ -40,12 +55,12 @@ async def evaluation_exception_handler(request: Request, exc: EvaluationError):
         content={
             "error": "Evaluation Error",
             "message": exc.message,
-            "details": exc.details,
+            "details": dict(exc.details),
             "type": exc.__class__.__name__
         }
     )
 
-async def file_processing_exception_handler(request: Request, exc: FileProcessingError):
+def file_processing_exception_handler(request: Request, exc: FileProcessingError):
     """Handle file processing exceptions"""
     logger.error(f"File processing error: {exc.message}", extra={"details": exc.details})
     
@@ -54,11 +69,11 @@ async def file_processing_exception_handler(request: Request, exc: FileProcessin
         content={
             "error": "File Processing Error",
             "message": exc.message,
-            "details": exc.details
+            "details": dict(exc.details)
         }
     )
 
-async def llm_service_exception_handler(request: Request, exc: LLMServiceError):
+def llm_service_exception_handler(request: Request, exc: LLMServiceError):
     """Handle LLM service exceptions"""
     logger.error(f"LLM service error: {exc.message}", extra={"details": exc.details})
     
@@ -71,7 +86,7 @@ async def llm_service_exception_handler(request: Request, exc: LLMServiceError):
         }
     )
 
-async def vector_database_exception_handler(request: Request, exc: VectorDatabaseError):
+def vector_database_exception_handler(request: Request, exc: VectorDatabaseError):
     """Handle vector database exceptions"""
     logger.warning(f"Vector database error: {exc.message}", extra={"details": exc.details})
     
@@ -84,7 +99,7 @@ async def vector_database_exception_handler(request: Request, exc: VectorDatabas
         }
     )
 
-async def validation_exception_handler(request: Request, exc: ValidationError):
+def validation_exception_handler(request: Request, exc: ValidationError):
     """Handle validation exceptions"""
     logger.warning(f"Validation error: {exc.message}", extra={"details": exc.details})
     
@@ -93,11 +108,11 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
         content={
             "error": "Validation Error",
             "message": exc.message,
-            "details": exc.details
+            "details": dict(exc.details)
         }
     )
 
-async def general_exception_handler(request: Request, exc: Exception):
+def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
     
@@ -1,8 +1,10 @@
 import asyncio
 import random
+import time
 from typing import Callable, Any, Optional, Type
 from functools import wraps
 import logging
+from app.core.exceptions import RateLimitError, TransientLLMError
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +25,29 @@ class RetryConfig:
         self.exponential_base = exponential_base
         self.jitter = jitter
         self.retryable_exceptions = retryable_exceptions
+        # Backoff ceilings are fixed per config, so precompute them once
+        # instead of paying an exponentiation per retry attempt
+        self._delay_table = tuple(
+            min(base_delay * (exponential_base ** (attempt - 1)), max_delay)
+            for attempt in range(1, max_attempts + 1)
+        )
 
 def calculate_delay(attempt: int, config: RetryConfig) -> float:
     """Calculate delay for retry attempt"""
-    delay = config.base_delay * (config.exponential_base ** (attempt - 1))
-    delay = min(delay, config.max_delay)
-    
+    if attempt <= len(config._delay_table):
+        delay = config._delay_table[attempt - 1]
+    else:
+        delay = min(
+            config.base_delay * (config.exponential_base ** (attempt - 1)),
+            config.max_delay
+        )
+
     if config.jitter:
-        # Add random jitter to prevent thundering herd
-        jitter_range = delay * 0.1
-        delay += random.uniform(-jitter_range, jitter_range)
-    
-    return max(0, delay)
+        # Full jitter (AWS-style): draw uniformly from [0, delay) so
+        # concurrent callers desynchronize instead of retrying in lockstep
+        delay *= random.random()
+
+    return delay
 
 def retry_async(config: RetryConfig = None):
     """Decorator for async functions with retry logic"""
@@ -53,22 +66,27 @@ def retry_async(config: RetryConfig = None):
                     last_exception = e
                     
                     if attempt == config.max_attempts:
-                        logger.error(
-                            f"Function {func.__name__} failed after {config.max_attempts} attempts",
-                            exc_info=True
-                        )
+                        if logger.isEnabledFor(logging.ERROR):
+                            logger.error(
+                                "Function %s failed after %d attempts",
+                                func.__name__, config.max_attempts,
+                                exc_info=True
+                            )
                         raise e
                     
                     delay = calculate_delay(attempt, config)
+                    # %-style args defer formatting until a handler accepts
+                    # the record, so filtered-out messages cost almost nothing
                     logger.warning(
-                        f"Function {func.__name__} failed on attempt {attempt}/{config.max_attempts}. "
-                        f"Retrying in {delay:.2f} seconds. Error: {str(e)}"
+                        "Function %s failed on attempt %d/%d. "
+                        "Retrying in %.2f seconds. Error: %s",
+                        func.__name__, attempt, config.max_attempts, delay, e
                     )
                     
                     await asyncio.sleep(delay)
                 except Exception as e:
                     # Non-retryable exception
-                    logger.error(f"Non-retryable error in {func.__name__}: {str(e)}")
+                    logger.error("Non-retryable error in %s: %s", func.__name__, e)
                     raise e
             
             # This should never be reached, but just in case
@@ -94,23 +112,25 @@ def retry_sync(config: RetryConfig = None):
                     last_exception = e
                     
                     if attempt == config.max_attempts:
-                        logger.error(
-                            f"Function {func.__name__} failed after {config.max_attempts} attempts",
-                            exc_info=True
-                        )
+                        if logger.isEnabledFor(logging.ERROR):
+                            logger.error(
+                                "Function %s failed after %d attempts",
+                                func.__name__, config.max_attempts,
+                                exc_info=True
+                            )
                         raise e
                     
                     delay = calculate_delay(attempt, config)
                     logger.warning(
-                        f"Function {func.__name__} failed on attempt {attempt}/{config.max_attempts}. "
-                        f"Retrying in {delay:.2f} seconds. Error: {str(e)}"
+                        "Function %s failed on attempt %d/%d. "
+                        "Retrying in %.2f seconds. Error: %s",
+                        func.__name__, attempt, config.max_attempts, delay, e
                     )
                     
-                    import time
                     time.sleep(delay)
                 except Exception as e:
                     # Non-retryable exception
-                    logger.error(f"Non-retryable error in {func.__name__}: {str(e)}")
+                    logger.error("Non-retryable error in %s: %s", func.__name__, e)
                     raise e
             
             # This should never be reached, but just in case
@@ -120,13 +140,17 @@ def retry_sync(config: RetryConfig = None):
     return decorator
 
 # Predefined retry configurations
+
+# Narrow allow-list: only rate limits and transient failures are retried.
+# Auth failures, invalid requests and model refusals raise plain
+# LLMServiceError and fail fast instead of being amplified max_attempts times
 LLM_RETRY_CONFIG = RetryConfig(
     max_attempts=3,
     base_delay=2.0,
     max_delay=30.0,
     exponential_base=2.0,
     jitter=True,
-    retryable_exceptions=(ConnectionError, TimeoutError, Exception)
+    retryable_exceptions=(RateLimitError, TransientLLMError, ConnectionError, TimeoutError)
 )
 
 VECTOR_DB_RETRY_CONFIG = RetryConfig(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import Optional, Dict, Any, List
 from enum import Enum
 import uuid
@@ -22,12 +22,22 @@ class UploadResponse(BaseModel):
     file_size: int
 
 class EvaluationRequest(BaseModel):
+    # Validation lives here so invalid payloads are rejected by FastAPI's
+    # 422 path before the handler runs
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     cv_file_id: Optional[str] = None
     project_report_file_id: Optional[str] = None
-    job_description: str = Field(..., description="Job vacancy description")
+    job_description: str = Field(..., min_length=1, description="Job vacancy description")
     study_case_brief: Optional[str] = Field(None, description="Study case brief for project evaluation")
     llm_provider: Optional[LLMProvider] = LLMProvider.OPENAI
 
+    @model_validator(mode='after')
+    def at_least_one_file(self):
+        if not (self.cv_file_id or self.project_report_file_id):
+            raise ValueError("At least one file (CV or project report) must be provided")
+        return self
+
 class EvaluationResponse(BaseModel):
     id: str
     status: JobStatus
@@ -50,14 +60,6 @@ class ProjectEvaluation(BaseModel):
     project_score: float = Field(..., ge=1, le=5)
     project_feedback: str
 
-class EvaluationResult(BaseModel):
-    id: str
-    status: JobStatus
-    created_at: datetime
-    completed_at: Optional[datetime] = None
-    result: Optional[Dict[str, Any]] = None
-    error_message: Optional[str] = None
-
 class CompleteEvaluationResult(BaseModel):
     cv_match_rate: float
     cv_feedback: str
@@ -65,6 +67,15 @@ class CompleteEvaluationResult(BaseModel):
     project_feedback: str
     overall_summary: str
 
+class EvaluationResult(BaseModel):
+    id: str
+    status: JobStatus
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    # Stored as the validated model instance; serialized once at response time
+    result: Optional[CompleteEvaluationResult] = None
+    error_message: Optional[str] = None
+
 class ResultResponse(BaseModel):
     id: str
     status: JobStatus
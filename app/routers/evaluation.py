@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from app.models.schemas import EvaluationRequest, EvaluationResponse, JobStatus
-from app.services.evaluation_service import evaluation_service
+from app.services.evaluation_service import get_evaluation_service
 
 router = APIRouter()
 
@@ -15,22 +15,11 @@ async def start_evaluation(request: EvaluationRequest):
     Returns a job ID that can be used to check evaluation status and results.
     """
     try:
-        # Validate that at least one file is provided
-        if not request.cv_file_id and not request.project_report_file_id:
-            raise HTTPException(
-                status_code=400, 
-                detail="At least one file (CV or project report) must be provided"
-            )
-        
-        # Validate job description
-        if not request.job_description.strip():
-            raise HTTPException(
-                status_code=400,
-                detail="Job description is required"
-            )
-        
+        # Input validation (at least one file, non-empty job description)
+        # happens in the EvaluationRequest model before this handler runs
+
         # Start evaluation process
-        job_id = await evaluation_service.start_evaluation(request)
+        job_id = await get_evaluation_service().start_evaluation(request)
         
         return EvaluationResponse(
             id=job_id,
@@ -54,7 +43,7 @@ async def get_evaluation_stats():
     Returns statistics about evaluation jobs for monitoring purposes.
     """
     try:
-        stats = evaluation_service.get_job_statistics()
+        stats = get_evaluation_service().get_job_statistics()
         return stats
     except Exception as e:
         raise HTTPException(
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Path
-from app.models.schemas import ResultResponse, JobStatus, CompleteEvaluationResult
-from app.services.evaluation_service import evaluation_service
+from app.models.schemas import ResultResponse, JobStatus
+from app.services.evaluation_service import get_evaluation_service
 
 router = APIRouter()
 
@@ -21,7 +21,7 @@ async def get_evaluation_result(
     """
     try:
         # Get job from evaluation service
-        job = evaluation_service.get_evaluation_result(job_id)
+        job = get_evaluation_service().get_evaluation_result(job_id)
         
         if not job:
             raise HTTPException(
@@ -29,11 +29,10 @@ async def get_evaluation_result(
                 detail=f"Evaluation job with ID '{job_id}' not found"
             )
         
-        # Prepare response
-        result = None
-        if job.status == JobStatus.COMPLETED and job.result:
-            result = CompleteEvaluationResult(**job.result)
-        
+        # Prepare response - job.result is already a validated
+        # CompleteEvaluationResult instance, pass it straight through
+        result = job.result if job.status == JobStatus.COMPLETED else None
+
         return ResultResponse(
             id=job.id,
             status=job.status,
@@ -59,14 +58,12 @@ async def get_all_results():
     Returns a list of all evaluation jobs with their current status.
     """
     try:
-        jobs = evaluation_service.get_all_jobs()
+        jobs = get_evaluation_service().get_all_jobs()
         
         results = []
         for job_id, job in jobs.items():
-            result = None
-            if job.status == JobStatus.COMPLETED and job.result:
-                result = CompleteEvaluationResult(**job.result)
-            
+            result = job.result if job.status == JobStatus.COMPLETED else None
+
             results.append(ResultResponse(
                 id=job.id,
                 status=job.status,
@@ -94,16 +91,12 @@ async def delete_evaluation_result(
     Removes the evaluation job and its results from memory.
     """
     try:
-        jobs = evaluation_service.get_all_jobs()
-        
-        if job_id not in jobs:
+        if not get_evaluation_service().delete_job(job_id):
             raise HTTPException(
                 status_code=404,
                 detail=f"Evaluation job with ID '{job_id}' not found"
             )
-        
-        del jobs[job_id]
-        
+
         return {"message": f"Evaluation job '{job_id}' deleted successfully"}
     
     except HTTPException:
@@ -1,25 +1,31 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from app.core.config import settings
 from app.models.schemas import UploadResponse
-from app.services.file_service import file_service
+from app.services.file_service import get_file_service
 
 router = APIRouter()
 
+def get_upload_dir() -> str:
+    """Upload target directory; tests override this dependency so parallel
+    runs never race on the shared settings object"""
+    return str(settings.UPLOAD_DIR)
+
 @router.post("/upload", response_model=UploadResponse)
-async def upload_file(file: UploadFile = File(...)):
+async def upload_file(file: UploadFile = File(...), upload_dir: str = Depends(get_upload_dir)):
     """
     Upload CV or Project Report file
-    
+
     Accepts: PDF, DOCX, TXT files
     Returns: File ID for later use in evaluation
     """
     try:
-        file_id, file_path = await file_service.save_file(file)
-        
+        file_id, file_path, bytes_written = await get_file_service().save_file(file, upload_dir=upload_dir)
+
         return UploadResponse(
             message="File uploaded successfully",
             file_id=file_id,
             filename=file.filename,
-            file_size=len(await file.read()) if hasattr(file, 'read') else 0
+            file_size=bytes_written
         )
     
     except HTTPException:
@@ -27,22 +33,14 @@ async def upload_file(file: UploadFile = File(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
-@router.post("/upload/cv", response_model=UploadResponse)
-async def upload_cv(file: UploadFile = File(...)):
-    """
-    Upload CV file specifically
-    
-    Accepts: PDF, DOCX, TXT files
-    Returns: File ID for later use in evaluation
-    """
-    return await upload_file(file)
-
-@router.post("/upload/project", response_model=UploadResponse)
-async def upload_project_report(file: UploadFile = File(...)):
-    """
-    Upload Project Report file specifically
-    
-    Accepts: PDF, DOCX, TXT files
-    Returns: File ID for later use in evaluation
-    """
-    return await upload_file(file)
\ No newline at end of file
+# The CV and project routes are zero-cost aliases of the same handler -
+# registering the endpoint directly avoids an extra coroutine frame per
+# request compared to wrapper functions that `return await upload_file(file)`
+router.add_api_route(
+    "/upload/cv", upload_file, methods=["POST"],
+    response_model=UploadResponse, name="upload_cv"
+)
+router.add_api_route(
+    "/upload/project", upload_file, methods=["POST"],
+    response_model=UploadResponse, name="upload_project_report"
+)
\ No newline at end of file
@@ -1,5 +1,8 @@
 import asyncio
+import logging
+import time
 import uuid
+from collections import Counter, OrderedDict
 from datetime import datetime
 from typing import Dict, Any, Optional
 from app.models.schemas import (
@@ -9,14 +12,31 @@ from app.models.schemas import (
     LLMProvider,
     CompleteEvaluationResult
 )
-from app.services.file_service import file_service
-from app.services.llm_service import llm_service
-from app.services.vector_service import vector_service
+from app.core.exceptions import FileProcessingError
+from app.services.file_service import get_file_service
+from app.services.llm_service import get_llm_service
+from app.services.vector_service import get_vector_service
+from app.core.config import settings
 
 class EvaluationService:
     def __init__(self):
-        # In-memory storage for evaluation jobs (in production, use Redis or database)
-        self.jobs: Dict[str, EvaluationResult] = {}
+        # In-memory storage for evaluation jobs (in production, use Redis or
+        # database). Bounded: oldest jobs are evicted beyond settings.MAX_JOBS
+        self.jobs: "OrderedDict[str, EvaluationResult]" = OrderedDict()
+        # Per-status counters maintained on state transitions so statistics
+        # are O(1) instead of a full scan over the jobs dict
+        self._status_counts: Counter = Counter()
+        # Monotonic completion times for the sweeper; wall-clock
+        # completed_at stays on the job record for API responses
+        self._job_mono: Dict[str, float] = {}
+        self._sweeper_task: Optional[asyncio.Task] = None
+        # Bulkhead state: a bounded job queue drained by a fixed worker pool,
+        # plus a semaphore capping concurrent outbound LLM calls. Created
+        # lazily because asyncio primitives need the serving event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._llm_sem: Optional[asyncio.Semaphore] = None
+        self._workers: list = []
+        self._worker_loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def start_evaluation(self, request: EvaluationRequest) -> str:
         """Start asynchronous evaluation process"""
@@ -29,129 +49,212 @@ class EvaluationService:
             created_at=datetime.now()
         )
         self.jobs[job_id] = job
-        
-        # Start evaluation in background
-        asyncio.create_task(self._process_evaluation(job_id, request))
-        
+        self._status_counts[JobStatus.QUEUED.value] += 1
+        self._evict_excess_jobs()
+
+        # Queue evaluation for the background worker pool
+        self._ensure_workers()
+        await self._queue.put((job_id, request))
+
         return job_id
+
+    def _ensure_workers(self) -> None:
+        """(Re)create the queue, semaphore and worker pool on the current loop"""
+        loop = asyncio.get_running_loop()
+        if self._worker_loop is loop:
+            return
+
+        # Tasks from a previous event loop are dead once that loop closed
+        # (this mainly matters for test clients that use a loop per request)
+        self._worker_loop = loop
+        self._queue = asyncio.Queue(maxsize=settings.MAX_QUEUED_JOBS)
+        self._llm_sem = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM)
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(settings.EVALUATION_WORKERS)
+        ]
+
+    async def _worker(self) -> None:
+        """Drain queued evaluations one at a time"""
+        while True:
+            job_id, request = await self._queue.get()
+            try:
+                await self._process_evaluation(job_id, request)
+            except Exception:
+                # A worker must outlive any single job: an escaping error
+                # would otherwise kill the task and shrink the pool forever
+                logging.exception("Evaluation worker error for job %s", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _with_llm_slot(self, coro):
+        """Run an LLM call while holding a bulkhead slot"""
+        async with self._llm_sem:
+            return await coro
     
     async def _process_evaluation(self, job_id: str, request: EvaluationRequest):
         """Process evaluation in background"""
         try:
-            # Update status to processing
-            self.jobs[job_id].status = JobStatus.PROCESSING
-            
-            # Extract text from uploaded files
-            cv_text = ""
-            project_text = ""
-            
-            if request.cv_file_id:
-                cv_text = await self._extract_file_text(request.cv_file_id)
-            
-            if request.project_report_file_id:
-                project_text = await self._extract_file_text(request.project_report_file_id)
-            
-            # Get enhanced context from vector database
-            enhanced_job_description = vector_service.get_job_description_context(request.job_description)
-            cv_scoring_context = vector_service.get_scoring_rubric_context("cv")
-            project_scoring_context = vector_service.get_scoring_rubric_context("project")
-            
-            # Perform evaluations
-            cv_result = {}
-            project_result = {}
-            
-            if cv_text:
-                cv_result = await llm_service.evaluate_cv(
-                    cv_text=cv_text,
-                    job_description=f"{enhanced_job_description}\n\nScoring Guidelines:\n{cv_scoring_context}",
-                    provider=request.llm_provider
-                )
-            
-            if project_text and request.study_case_brief:
-                project_result = await llm_service.evaluate_project(
-                    project_text=project_text,
-                    study_case_brief=f"{request.study_case_brief}\n\nScoring Guidelines:\n{project_scoring_context}",
-                    provider=request.llm_provider
-                )
-            
-            # Generate overall summary
-            overall_summary = await llm_service.generate_overall_summary(
-                cv_result=cv_result,
-                project_result=project_result,
-                provider=request.llm_provider
-            )
-            
-            # Combine results
-            complete_result = CompleteEvaluationResult(
-                cv_match_rate=cv_result.get("cv_match_rate", 0.0),
-                cv_feedback=cv_result.get("cv_feedback", "No CV evaluation performed"),
-                project_score=project_result.get("project_score", 0.0),
-                project_feedback=project_result.get("project_feedback", "No project evaluation performed"),
-                overall_summary=overall_summary
-            )
-            
-            # Update job with results
-            self.jobs[job_id].status = JobStatus.COMPLETED
-            self.jobs[job_id].completed_at = datetime.now()
-            self.jobs[job_id].result = complete_result.dict()
-            
+            async with asyncio.timeout(settings.EVALUATION_DEADLINE_S):
+                await self._run_evaluation(job_id, request)
+
+        except TimeoutError:
+            # Deadline exceeded - record the failure and free the worker slot
+            self._set_status(job_id, JobStatus.FAILED)
+            job = self.jobs.get(job_id)
+            if job is not None:
+                job.error_message = "deadline exceeded"
+                job.completed_at = datetime.now()
+
         except Exception as e:
-            # Handle errors
-            self.jobs[job_id].status = JobStatus.FAILED
-            self.jobs[job_id].error_message = str(e)
-            self.jobs[job_id].completed_at = datetime.now()
-    
+            # Handle errors; the job may have been evicted while in flight
+            self._set_status(job_id, JobStatus.FAILED)
+            job = self.jobs.get(job_id)
+            if job is not None:
+                job.error_message = str(e)
+                job.completed_at = datetime.now()
+
+    async def _run_evaluation(self, job_id: str, request: EvaluationRequest):
+        """Run the evaluation pipeline for a job"""
+        # Update status to processing
+        self._set_status(job_id, JobStatus.PROCESSING)
+
+        # Extract text from uploaded files
+        cv_text = ""
+        project_text = ""
+
+        if request.cv_file_id:
+            cv_text = await self._extract_file_text(request.cv_file_id)
+
+        if request.project_report_file_id:
+            project_text = await self._extract_file_text(request.project_report_file_id)
+
+        # Fetch all vector-database context in one batched query, run in a
+        # thread since the Chroma client is synchronous
+        enhanced_job_description, cv_scoring_context, project_scoring_context = (
+            await asyncio.to_thread(get_vector_service().get_contexts, request.job_description)
+        )
+
+        # CV and project evaluations run concurrently inside evaluate_all;
+        # each LLM call holds a bulkhead slot via the limiter
+        cv_result, project_result, overall_summary = await get_llm_service().evaluate_all(
+            cv_text=cv_text,
+            job_description=f"{enhanced_job_description}\n\nScoring Guidelines:\n{cv_scoring_context}",
+            project_text=project_text,
+            study_case_brief=(
+                f"{request.study_case_brief}\n\nScoring Guidelines:\n{project_scoring_context}"
+                if request.study_case_brief else None
+            ),
+            provider=request.llm_provider,
+            limiter=self._with_llm_slot,
+        )
+
+        # Combine results
+        complete_result = CompleteEvaluationResult(
+            cv_match_rate=cv_result.get("cv_match_rate", 0.0),
+            cv_feedback=cv_result.get("cv_feedback", "No CV evaluation performed"),
+            project_score=project_result.get("project_score", 0.0),
+            project_feedback=project_result.get("project_feedback", "No project evaluation performed"),
+            overall_summary=overall_summary
+        )
+
+        # Update job with results; skip if the job was evicted while running
+        self._set_status(job_id, JobStatus.COMPLETED)
+        job = self.jobs.get(job_id)
+        if job is not None:
+            job.completed_at = datetime.now()
+            job.result = complete_result
+
+    def _set_status(self, job_id: str, status: JobStatus) -> None:
+        """Transition a job's status, keeping the status counters in sync"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        self._status_counts[job.status.value] -= 1
+        job.status = status
+        self._status_counts[status.value] += 1
+        if status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            self._job_mono[job_id] = time.monotonic()
+
+    def _evict_excess_jobs(self) -> None:
+        """Evict oldest jobs beyond the configured cap"""
+        while len(self.jobs) > settings.MAX_JOBS:
+            evicted_id, evicted = self.jobs.popitem(last=False)
+            self._status_counts[evicted.status.value] -= 1
+            self._job_mono.pop(evicted_id, None)
+
     async def _extract_file_text(self, file_id: str) -> str:
         """Extract text from uploaded file"""
-        try:
-            # Try different file extensions
-            for ext in ['.pdf', '.docx', '.txt']:
-                file_path = file_service.get_file_path(file_id, ext)
-                try:
-                    return file_service.extract_text(file_path)
-                except:
-                    continue
-            
-            raise Exception(f"Could not find or read file with ID: {file_id}")
-        
-        except Exception as e:
-            raise Exception(f"Failed to extract text from file {file_id}: {str(e)}")
+        meta = get_file_service().get_meta(file_id)
+        if meta is None:
+            raise FileProcessingError(
+                f"Could not find file with ID: {file_id}",
+                {"file_id": file_id}
+            )
+
+        return await get_file_service().extract_text_async(meta["path"])
     
     def get_evaluation_result(self, job_id: str) -> Optional[EvaluationResult]:
         """Get evaluation result by job ID"""
-        return self.jobs.get(job_id)
+        job = self.jobs.get(job_id)
+        if job is not None:
+            self.jobs.move_to_end(job_id)
+        return job
     
     def get_all_jobs(self) -> Dict[str, EvaluationResult]:
         """Get all evaluation jobs (for debugging)"""
         return self.jobs
     
+    def delete_job(self, job_id: str) -> bool:
+        """Delete a job, keeping the status counters in sync"""
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return False
+        self._status_counts[job.status.value] -= 1
+        self._job_mono.pop(job_id, None)
+        return True
+
     def cleanup_old_jobs(self, max_age_hours: int = 24):
         """Clean up old completed jobs"""
-        current_time = datetime.now()
-        jobs_to_remove = []
-        
-        for job_id, job in self.jobs.items():
-            if job.completed_at:
-                age_hours = (current_time - job.completed_at).total_seconds() / 3600
-                if age_hours > max_age_hours:
-                    jobs_to_remove.append(job_id)
-        
+        # Monotonic deltas: one float subtract per job, immune to wall-clock
+        # adjustments, and no per-job timedelta allocation
+        now_mono = time.monotonic()
+        max_age_seconds = max_age_hours * 3600
+        jobs_to_remove = [
+            job_id for job_id, completed_mono in self._job_mono.items()
+            if now_mono - completed_mono > max_age_seconds
+        ]
+
         for job_id in jobs_to_remove:
-            del self.jobs[job_id]
+            self.delete_job(job_id)
+
+    def start_background_sweeper(self) -> None:
+        """Start the periodic job sweeper (called from app startup)"""
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self) -> None:
+        """Periodically clean up old completed jobs"""
+        while True:
+            await asyncio.sleep(settings.JOB_SWEEP_INTERVAL_S)
+            self.cleanup_old_jobs()
     
     def get_job_statistics(self) -> Dict[str, Any]:
         """Get job statistics"""
-        total_jobs = len(self.jobs)
-        status_counts = {}
-        
-        for job in self.jobs.values():
-            status = job.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
         return {
-            "total_jobs": total_jobs,
-            "status_breakdown": status_counts
+            "total_jobs": len(self.jobs),
+            "status_breakdown": {
+                status: count for status, count in self._status_counts.items() if count
+            }
         }
 
-# Global instance
-evaluation_service = EvaluationService()
\ No newline at end of file
+# Lazily built process-wide instance; importing the module no longer pulls
+# in the file/LLM/vector services transitively at import time
+_evaluation_service: Optional[EvaluationService] = None
+
+def get_evaluation_service() -> EvaluationService:
+    """Return the shared EvaluationService, building it on first use"""
+    global _evaluation_service
+    if _evaluation_service is None:
+        _evaluation_service = EvaluationService()
+    return _evaluation_service
\ No newline at end of file
@@ -1,11 +1,16 @@
 import asyncio
-import json
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 import logging
+import httpx
+import orjson
+from pydantic import BaseModel
 from app.core.config import settings
 from app.models.schemas import LLMProvider, CVEvaluation, ProjectEvaluation
-from app.core.exceptions import LLMServiceError
+from app.core.exceptions import LLMServiceError, RateLimitError, TransientLLMError
 from app.core.retry import retry_async, LLM_RETRY_CONFIG
+from app.core.circuit import llm_circuit_breaker
 
 # Import LLM clients
 try:
@@ -20,17 +25,197 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+def _classify_llm_error(e: Exception, message: str, details: Dict[str, Any]) -> LLMServiceError:
+    """Map a provider error to the matching exception class.
+
+    Only rate limits (429) and transient failures (408/5xx/network) come back
+    as retryable types; auth failures and invalid requests stay plain
+    LLMServiceError so the retry decorator fails fast on them.
+    """
+    status = getattr(e, 'status_code', None) or getattr(e, 'http_status', None)
+    if status == 429:
+        return RateLimitError(message, details)
+    if status == 408 or (status is not None and status >= 500):
+        return TransientLLMError(message, details)
+    if status is None and isinstance(e, (ConnectionError, TimeoutError, OSError)):
+        return TransientLLMError(message, details)
+    return LLMServiceError(message, details)
+
+
+# Prompt templates live at module level so each request only pays for the
+# substitution, not rebuilding the static text; literal JSON braces are
+# doubled for str.format
+_CV_EVALUATION_PROMPT = """
+        Evaluate the following CV against the job requirements and return a JSON response with the following structure:
+        {{
+            "technical_skills_match": 0.0-1.0,
+            "experience_level": 0.0-1.0,
+            "relevant_achievements": 0.0-1.0,
+            "cultural_fit": 0.0-1.0,
+            "cv_match_rate": 0.0-1.0,
+            "cv_feedback": "detailed feedback string"
+        }}
+        
+        Job Description:
+        {job_description}
+        
+        CV Content:
+        {cv_text}
+        
+        Evaluate based on:
+        1. Technical Skills Match (backend, databases, APIs, cloud, AI/LLM exposure)
+        2. Experience Level (years, project complexity)
+        3. Relevant Achievements (impact, scale)
+        4. Cultural Fit (communication, learning attitude)
+        
+        Return only valid JSON.
+        """
+
+_PROJECT_EVALUATION_PROMPT = """
+        Evaluate the following project report against the study case requirements and return a JSON response with the following structure:
+        {{
+            "correctness": 1-5,
+            "code_quality": 1-5,
+            "resilience": 1-5,
+            "documentation": 1-5,
+            "creativity_bonus": 1-5,
+            "project_score": 1-5,
+            "project_feedback": "detailed feedback string"
+        }}
+        
+        Study Case Brief:
+        {study_case_brief}
+        
+        Project Report:
+        {project_text}
+        
+        Evaluate based on:
+        1. Correctness (meets requirements: prompt design, chaining, RAG, handling errors)
+        2. Code Quality (clean, modular, testable)
+        3. Resilience (handles failures, retries)
+        4. Documentation (clear README, explanation of trade-offs)
+        5. Creativity/Bonus (optional improvements like authentication, deployment, dashboards)
+        
+        Return only valid JSON.
+        """
+
+_SUMMARY_PROMPT = """
+        Based on the CV evaluation and project evaluation results below, provide a concise overall summary of the candidate's fit for the backend developer position.
+        
+        CV Results: {cv_results}
+        Project Results: {project_results}
+        
+        Provide a 2-3 sentence summary highlighting strengths and areas for improvement.
+        """
+
+def _extract_first_json(response: str) -> Optional[str]:
+    """Return the first balanced top-level JSON object in ``response``.
+
+    Single forward pass with the same string/escape-aware state machine as
+    :class:`_JsonStreamTracker`; unlike find('{')/rfind('}') it isn't fooled
+    by prose after the object or by a second object in the same response.
+    Returns None when no complete object is present.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(response):
+        if escaped:
+            escaped = False
+        elif in_string:
+            if ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return response[start:i + 1]
+    return None
+
+async def _skip() -> Dict[str, Any]:
+    """Stand-in coroutine for evaluations that are skipped"""
+    return {}
+
+class _JsonStreamTracker:
+    """Tracks brace depth across streamed chunks.
+
+    Lets the caller stop consuming a stream as soon as the first top-level
+    JSON object closes instead of waiting for the model to finish; string
+    literals and escapes are honored so braces inside values don't count.
+    """
+    __slots__ = ('_depth', '_in_string', '_escaped', '_started')
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+
+    def feed(self, piece: str) -> bool:
+        """Consume a chunk; True once a complete top-level object has closed"""
+        for ch in piece:
+            if self._escaped:
+                self._escaped = False
+            elif self._in_string:
+                if ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+                self._started = True
+            elif ch == '}' and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+
 class LLMService:
     def __init__(self):
         self.setup_clients()
+        # Exact-match response cache: sha256(prompt) -> raw response text.
+        # Repeat evaluations of the same CV/job pair skip the provider call
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Lazily created ChromaDB collection for the semantic tier
+        self._semantic_collection = None
     
     def setup_clients(self):
         """Setup LLM clients based on available API keys"""
+        # One AsyncOpenAI client for the life of the service: its pooled
+        # httpx transport keeps connections warm across calls, amortizing
+        # the TLS handshake instead of paying it per request
+        self._oai = None
         if OPENAI_AVAILABLE and settings.OPENAI_API_KEY:
-            openai.api_key = settings.OPENAI_API_KEY
-        
+            self._oai = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_keepalive_connections=20)
+                )
+            )
+
         if GEMINI_AVAILABLE and settings.GEMINI_API_KEY:
             genai.configure(api_key=settings.GEMINI_API_KEY)
+
+        # GenerativeModel construction does nontrivial setup work, so build
+        # each model once per name instead of per request
+        self._gemini_models: Dict[str, Any] = {}
+
+    def _get_gemini_model(self, name: str):
+        """Return the cached GenerativeModel for this name, creating it once"""
+        model = self._gemini_models.get(name)
+        if model is None:
+            model = self._gemini_models.setdefault(name, genai.GenerativeModel(name))
+        return model
     
     async def evaluate_cv(self, cv_text: str, job_description: str, provider: LLMProvider = LLMProvider.MOCK) -> CVEvaluation:
         """Evaluate CV with fallback to mock data on failure"""
@@ -38,9 +223,9 @@ class LLMService:
             prompt = self._create_cv_evaluation_prompt(cv_text, job_description)
             
             if provider == LLMProvider.OPENAI and OPENAI_AVAILABLE and settings.OPENAI_API_KEY:
-                response = await self._call_openai(prompt)
+                response = await self._cached_call(provider, self._call_openai, prompt)
             elif provider == LLMProvider.GEMINI and GEMINI_AVAILABLE and settings.GEMINI_API_KEY:
-                response = await self._call_gemini(prompt)
+                response = await self._cached_call(provider, self._call_gemini, prompt)
             else:  # MOCK or fallback
                 return CVEvaluation(**self._mock_cv_evaluation())
             
@@ -57,9 +242,9 @@ class LLMService:
             prompt = self._create_project_evaluation_prompt(project_text, study_case_brief)
             
             if provider == LLMProvider.OPENAI and OPENAI_AVAILABLE and settings.OPENAI_API_KEY:
-                response = await self._call_openai(prompt)
+                response = await self._cached_call(provider, self._call_openai, prompt)
             elif provider == LLMProvider.GEMINI and GEMINI_AVAILABLE and settings.GEMINI_API_KEY:
-                response = await self._call_gemini(prompt)
+                response = await self._cached_call(provider, self._call_gemini, prompt)
             else:  # MOCK or fallback
                 return ProjectEvaluation(**self._mock_project_evaluation())
             
@@ -70,15 +255,70 @@ class LLMService:
             logging.warning(f"LLM evaluation failed, using mock data: {str(e)}")
             return ProjectEvaluation(**self._mock_project_evaluation())
 
+    async def evaluate_all(
+        self,
+        cv_text: str,
+        job_description: str,
+        project_text: str,
+        study_case_brief: Optional[str],
+        provider: LLMProvider = LLMProvider.MOCK,
+        limiter=None,
+    ) -> tuple[Dict[str, Any], Dict[str, Any], str]:
+        """Evaluate CV and project concurrently, then summarize.
+
+        The two evaluations are independent network round-trips, so running
+        them under asyncio.gather makes the wall clock max(cv, project)
+        + summary instead of the sum. `limiter` optionally wraps each LLM
+        call (e.g. with a concurrency semaphore); failures degrade to empty
+        results rather than aborting the whole evaluation.
+        """
+        if limiter is None:
+            async def limiter(coro):
+                return await coro
+
+        cv_coro = limiter(self.evaluate_cv(
+            cv_text=cv_text,
+            job_description=job_description,
+            provider=provider
+        )) if cv_text else _skip()
+
+        project_coro = limiter(self.evaluate_project(
+            project_text=project_text,
+            study_case_brief=study_case_brief,
+            provider=provider
+        )) if project_text and study_case_brief else _skip()
+
+        cv_result, project_result = await asyncio.gather(
+            cv_coro, project_coro, return_exceptions=True
+        )
+        cv_result = self._as_result_dict(cv_result)
+        project_result = self._as_result_dict(project_result)
+
+        summary = await limiter(self.generate_overall_summary(
+            cv_result=cv_result,
+            project_result=project_result,
+            provider=provider
+        ))
+        return cv_result, project_result, summary
+
+    @staticmethod
+    def _as_result_dict(result: Any) -> Dict[str, Any]:
+        """Normalize a gathered evaluation result to a plain dict"""
+        if isinstance(result, BaseException):
+            return {}
+        if isinstance(result, BaseModel):
+            return result.model_dump()
+        return result or {}
+
     async def generate_overall_summary(self, cv_result: Dict[str, Any], project_result: Dict[str, Any], provider: LLMProvider = LLMProvider.MOCK) -> str:
         """Generate overall summary with fallback"""
         try:
             prompt = self._create_summary_prompt(cv_result, project_result)
             
             if provider == LLMProvider.OPENAI and OPENAI_AVAILABLE and settings.OPENAI_API_KEY:
-                response = await self._call_openai(prompt)
+                response = await self._cached_call(provider, self._call_openai, prompt)
             elif provider == LLMProvider.GEMINI and GEMINI_AVAILABLE and settings.GEMINI_API_KEY:
-                response = await self._call_gemini(prompt)
+                response = await self._cached_call(provider, self._call_gemini, prompt)
             else:  # MOCK or fallback
                 return self._get_mock_summary()
             
@@ -88,74 +328,85 @@ class LLMService:
             logging.warning(f"Summary generation failed, using mock summary: {str(e)}")
             return self._get_mock_summary()
     
+    async def _cached_call(self, provider, call, prompt: str) -> str:
+        """Look up the response cache before going over the network"""
+        key = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+
+        if settings.LLM_SEMANTIC_CACHE:
+            cached = self._semantic_lookup(prompt)
+            if cached is not None:
+                return cached
+
+        response = await llm_circuit_breaker.call(provider, call, prompt)
+
+        self._response_cache[key] = response
+        while len(self._response_cache) > settings.LLM_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        if settings.LLM_SEMANTIC_CACHE:
+            self._semantic_store(key, prompt, response)
+
+        return response
+
+    def _get_semantic_collection(self):
+        """ChromaDB collection backing the semantic cache tier"""
+        if self._semantic_collection is None:
+            from app.services.vector_service import get_vector_service
+            self._semantic_collection = get_vector_service().client.get_or_create_collection(
+                name="llm_cache",
+                metadata={"hnsw:space": "cosine"}
+            )
+        return self._semantic_collection
+
+    def _semantic_lookup(self, prompt: str) -> Optional[str]:
+        """Return a cached response for a near-identical prompt, if any"""
+        try:
+            result = self._get_semantic_collection().query(
+                query_texts=[prompt], n_results=1
+            )
+            if result["ids"] and result["ids"][0]:
+                similarity = 1.0 - result["distances"][0][0]
+                if similarity >= settings.LLM_SEMANTIC_CACHE_THRESHOLD:
+                    return result["metadatas"][0][0]["response"]
+        except Exception as e:
+            logging.debug(f"Semantic cache lookup failed: {str(e)}")
+        return None
+
+    def _semantic_store(self, key: str, prompt: str, response: str) -> None:
+        """Best-effort write to the semantic cache tier"""
+        try:
+            self._get_semantic_collection().add(
+                ids=[key],
+                documents=[prompt],
+                metadatas=[{"response": response}]
+            )
+        except Exception as e:
+            logging.debug(f"Semantic cache store failed: {str(e)}")
+
     def _create_cv_evaluation_prompt(self, cv_text: str, job_description: str) -> str:
         """Create prompt for CV evaluation"""
-        return f"""
-        Evaluate the following CV against the job requirements and return a JSON response with the following structure:
-        {{
-            "technical_skills_match": 0.0-1.0,
-            "experience_level": 0.0-1.0,
-            "relevant_achievements": 0.0-1.0,
-            "cultural_fit": 0.0-1.0,
-            "cv_match_rate": 0.0-1.0,
-            "cv_feedback": "detailed feedback string"
-        }}
-        
-        Job Description:
-        {job_description}
-        
-        CV Content:
-        {cv_text}
-        
-        Evaluate based on:
-        1. Technical Skills Match (backend, databases, APIs, cloud, AI/LLM exposure)
-        2. Experience Level (years, project complexity)
-        3. Relevant Achievements (impact, scale)
-        4. Cultural Fit (communication, learning attitude)
-        
-        Return only valid JSON.
-        """
+        return _CV_EVALUATION_PROMPT.format_map({
+            "job_description": job_description,
+            "cv_text": cv_text,
+        })
     
     def _create_project_evaluation_prompt(self, project_text: str, study_case_brief: str) -> str:
         """Create prompt for project evaluation"""
-        return f"""
-        Evaluate the following project report against the study case requirements and return a JSON response with the following structure:
-        {{
-            "correctness": 1-5,
-            "code_quality": 1-5,
-            "resilience": 1-5,
-            "documentation": 1-5,
-            "creativity_bonus": 1-5,
-            "project_score": 1-5,
-            "project_feedback": "detailed feedback string"
-        }}
-        
-        Study Case Brief:
-        {study_case_brief}
-        
-        Project Report:
-        {project_text}
-        
-        Evaluate based on:
-        1. Correctness (meets requirements: prompt design, chaining, RAG, handling errors)
-        2. Code Quality (clean, modular, testable)
-        3. Resilience (handles failures, retries)
-        4. Documentation (clear README, explanation of trade-offs)
-        5. Creativity/Bonus (optional improvements like authentication, deployment, dashboards)
-        
-        Return only valid JSON.
-        """
+        return _PROJECT_EVALUATION_PROMPT.format_map({
+            "study_case_brief": study_case_brief,
+            "project_text": project_text,
+        })
     
     def _create_summary_prompt(self, cv_result: Dict, project_result: Dict) -> str:
         """Create prompt for overall summary"""
-        return f"""
-        Based on the CV evaluation and project evaluation results below, provide a concise overall summary of the candidate's fit for the backend developer position.
-        
-        CV Results: {json.dumps(cv_result)}
-        Project Results: {json.dumps(project_result)}
-        
-        Provide a 2-3 sentence summary highlighting strengths and areas for improvement.
-        """
+        return _SUMMARY_PROMPT.format_map({
+            "cv_results": orjson.dumps(cv_result).decode(),
+            "project_results": orjson.dumps(project_result).decode(),
+        })
     
     async def _evaluate_with_openai(self, prompt: str, eval_type: str) -> Dict[str, Any]:
         """Evaluate using OpenAI"""
@@ -169,47 +420,75 @@ class LLMService:
     
     @retry_async(LLM_RETRY_CONFIG)
     async def _call_openai(self, prompt: str, model: str = None) -> str:
-        """Call OpenAI API with retry logic"""
+        """Call OpenAI API with retry logic, streaming the response"""
         try:
             model = model or settings.OPENAI_MODEL
-            response = await openai.ChatCompletion.acreate(
+            stream = await self._oai.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=2000,
-                temperature=0.3
+                temperature=0.3,
+                stream=True
             )
-            return response.choices[0].message.content.strip()
+            # Accumulate deltas and cut the stream once the JSON payload is
+            # complete - the remaining tokens would be discarded by the
+            # parser anyway, so stopping early saves latency and billing
+            parts = []
+            tracker = _JsonStreamTracker()
+            async for chunk in stream:
+                piece = chunk.choices[0].delta.content or ""
+                if not piece:
+                    continue
+                parts.append(piece)
+                if tracker.feed(piece):
+                    await stream.response.aclose()
+                    break
+            return "".join(parts).strip()
+        except LLMServiceError:
+            raise
         except Exception as e:
             logging.error(f"OpenAI API call failed: {str(e)}")
-            raise LLMServiceError(f"OpenAI API call failed: {str(e)}", {"model": model})
+            raise _classify_llm_error(e, f"OpenAI API call failed: {str(e)}", {"model": model})
 
     @retry_async(LLM_RETRY_CONFIG)
     async def _call_gemini(self, prompt: str, model: str = None) -> str:
         """Call Gemini API with retry logic"""
         try:
             model_name = model or settings.GEMINI_MODEL
-            model = genai.GenerativeModel(model_name)
+            model = self._get_gemini_model(model_name)
             response = await model.generate_content_async(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     max_output_tokens=2000,
                     temperature=0.3
-                )
+                ),
+                stream=True
             )
-            return response.text.strip()
+            parts = []
+            tracker = _JsonStreamTracker()
+            async for chunk in response:
+                piece = chunk.text or ""
+                if not piece:
+                    continue
+                parts.append(piece)
+                if tracker.feed(piece):
+                    break
+            return "".join(parts).strip()
+        except LLMServiceError:
+            raise
         except Exception as e:
             logging.error(f"Gemini API call failed: {str(e)}")
-            raise LLMServiceError(f"Gemini API call failed: {str(e)}", {"model": model_name})
+            raise _classify_llm_error(e, f"Gemini API call failed: {str(e)}", {"model": model_name})
     
     def _parse_json_response(self, response: str, eval_type: str) -> Dict[str, Any]:
         """Parse JSON response from LLM"""
         try:
             # Try to extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                return json.loads(json_str)
+            json_text = _extract_first_json(response)
+            if json_text is not None:
+                # orjson's Rust parser is several times faster than the
+                # stdlib on these small-but-frequent payloads
+                return orjson.loads(json_text)
             else:
                 raise ValueError("No JSON found in response")
         except Exception as e:
@@ -245,5 +524,13 @@ class LLMService:
         """Mock summary for testing"""
         return "Strong backend developer with good technical skills and project execution. Shows potential for AI integration work with room for improvement in error handling and documentation."
 
-# Global instance
-llm_service = LLMService()
\ No newline at end of file
+# Lazily built process-wide instance so importing the module doesn't touch
+# SDK client setup or the response caches
+_llm_service: Optional[LLMService] = None
+
+def get_llm_service() -> LLMService:
+    """Return the shared LLMService, building it on first use"""
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService()
+    return _llm_service
\ No newline at end of file
@@ -1,3 +1,6 @@
+import hashlib
+from collections import OrderedDict
+
 import chromadb
 from chromadb.config import Settings
 from typing import List, Dict, Any, Optional
@@ -18,6 +21,10 @@ class VectorService:
                 )
             )
             self.collection = self._get_or_create_collection()
+            # Memoized query embeddings: the same job description is
+            # re-embedded for every CV submitted against that posting, and
+            # each embedding is a transformer forward pass
+            self._embedding_cache: "OrderedDict[bytes, Any]" = OrderedDict()
             self._initialize_default_data()
             logging.info("Vector database initialized successfully")
         except Exception as e:
@@ -102,17 +109,22 @@ class VectorService:
         
         try:
             ids = [item["id"] for item in default_data]
-            documents = [item["content"] for item in default_data]
-            metadatas = [{"type": item["type"], "category": item["category"]} for item in default_data]
-            
+
+            # Skip documents that survived a previous start - re-adding them
+            # would force Chroma to re-embed on every boot/reload
+            existing = set(self.collection.get(ids=ids)["ids"])
+            default_data = [item for item in default_data if item["id"] not in existing]
+            if not default_data:
+                return
+
             self.collection.add(
-                ids=ids,
-                documents=documents,
-                metadatas=metadatas
+                ids=[item["id"] for item in default_data],
+                documents=[item["content"] for item in default_data],
+                metadatas=[{"type": item["type"], "category": item["category"]} for item in default_data]
             )
-            print("Initialized vector database with default data")
+            logging.info("Initialized vector database with %d default documents", len(default_data))
         except Exception as e:
-            print(f"Failed to initialize default data: {str(e)}")
+            logging.warning(f"Failed to initialize default data: {str(e)}")
     
     def add_job_description(self, job_id: str, job_description: str, category: str = "general") -> bool:
         """Add job description to vector database"""
@@ -146,15 +158,55 @@ class VectorService:
             print(f"Failed to add scoring rubric: {str(e)}")
             return False
     
-    @retry_sync(VECTOR_DB_RETRY_CONFIG)
-    def search_context(self, query: str, n_results: int = 3) -> List[Dict[str, Any]]:
-        """Search for relevant context with retry logic and fallback"""
+    _EMBEDDING_CACHE_SIZE = 1024
+
+    def _embed_queries(self, queries: List[str]) -> Optional[List[Any]]:
+        """Embed queries through a small LRU; None means the caller should
+        let Chroma embed the raw texts itself"""
+        embed_fn = getattr(self.collection, "_embedding_function", None)
+        if embed_fn is None:
+            return None
+
         try:
-            results = self.collection.query(
-                query_texts=[query],
+            keys = [hashlib.blake2b(q.encode(), digest_size=16).digest() for q in queries]
+            misses = [(i, q) for i, (key, q) in enumerate(zip(keys, queries))
+                      if key not in self._embedding_cache]
+            if misses:
+                computed = embed_fn([q for _, q in misses])
+                for (i, _), embedding in zip(misses, computed):
+                    self._embedding_cache[keys[i]] = embedding
+
+            embeddings = []
+            for key in keys:
+                self._embedding_cache.move_to_end(key)
+                embeddings.append(self._embedding_cache[key])
+            while len(self._embedding_cache) > self._EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+            return embeddings
+        except Exception as e:
+            logging.debug(f"Query embedding failed, deferring to Chroma: {str(e)}")
+            return None
+
+    def _query(self, queries: List[str], n_results: int):
+        """Issue a (possibly batched) query, reusing cached embeddings"""
+        embeddings = self._embed_queries(queries)
+        if embeddings is not None:
+            return self.collection.query(
+                query_embeddings=embeddings,
                 n_results=n_results,
                 include=["documents", "metadatas", "distances"]
             )
+        return self.collection.query(
+            query_texts=queries,
+            n_results=n_results,
+            include=["documents", "metadatas", "distances"]
+        )
+
+    @retry_sync(VECTOR_DB_RETRY_CONFIG)
+    def search_context(self, query: str, n_results: int = 3) -> List[Dict[str, Any]]:
+        """Search for relevant context with retry logic and fallback"""
+        try:
+            results = self._query([query], n_results)
             
             if not results["documents"] or not results["documents"][0]:
                 logging.warning("No results found in vector search, using fallback context")
@@ -189,41 +241,81 @@ class VectorService:
             }
         ]
     
-    def get_job_description_context(self, job_description: str) -> str:
-        """Get relevant job description context for evaluation"""
-        results = self.search_relevant_context(
-            query=job_description,
-            context_type="job_description",
-            n_results=2
+    @retry_sync(VECTOR_DB_RETRY_CONFIG)
+    def search_multi(self, queries: List[str], n_results: int = 3) -> List[List[Dict[str, Any]]]:
+        """Run several searches in one ChromaDB round trip.
+
+        Returns one result list per query, in query order; every query
+        degrades to the fallback context if the batched call fails.
+        """
+        try:
+            results = self._query(queries, n_results)
+
+            per_query = []
+            for q_idx in range(len(queries)):
+                documents = results["documents"][q_idx] if results["documents"] else []
+                if not documents:
+                    per_query.append(self._get_fallback_context())
+                    continue
+                per_query.append([
+                    {
+                        "content": doc,
+                        "metadata": results["metadatas"][q_idx][i] if results["metadatas"][q_idx] else {},
+                        "distance": results["distances"][q_idx][i] if results["distances"][q_idx] else 1.0
+                    }
+                    for i, doc in enumerate(documents)
+                ])
+            return per_query
+
+        except Exception as e:
+            logging.warning(f"Batched vector search failed, using fallback context: {str(e)}")
+            return [self._get_fallback_context() for _ in queries]
+
+    def get_contexts(self, job_description: str) -> tuple:
+        """Fetch job-description and both scoring-rubric contexts in one query.
+
+        One multi-query RPC replaces the three separate searches an
+        evaluation used to issue.
+        """
+        job_results, cv_results, project_results = self.search_multi(
+            [job_description, "cv evaluation scoring", "project evaluation scoring"],
+            n_results=4
         )
-        
+        return (
+            self._format_job_context(job_description, self._of_type(job_results, "job_description")),
+            self._format_rubric_context(self._of_type(cv_results, "scoring_rubric")),
+            self._format_rubric_context(self._of_type(project_results, "scoring_rubric")),
+        )
+
+    @staticmethod
+    def _of_type(results: List[Dict[str, Any]], doc_type: str, limit: int = 2) -> List[Dict[str, Any]]:
+        """Keep only results of the given metadata type (batched queries
+        can't carry per-query where-filters)"""
+        return [r for r in results if r["metadata"].get("type") == doc_type][:limit]
+
+    @staticmethod
+    def _format_job_context(job_description: str, results: List[Dict[str, Any]]) -> str:
         if not results:
             return job_description
-        
-        # Combine original job description with similar ones
-        context = f"Primary Job Description:\n{job_description}\n\n"
-        context += "Similar Job Requirements:\n"
-        for result in results:
-            context += f"- {result['content']}\n"
-        
-        return context
+        lines = [f"Primary Job Description:\n{job_description}\n", "Similar Job Requirements:"]
+        lines.extend(f"- {result['content']}" for result in results)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_rubric_context(results: List[Dict[str, Any]]) -> str:
+        if not results:
+            return "Use standard evaluation criteria."
+        return "Scoring Guidelines:\n" + "".join(f"{result['content']}\n\n" for result in results)
+
+    def get_job_description_context(self, job_description: str) -> str:
+        """Get relevant job description context for evaluation"""
+        results = self.search_multi([job_description], n_results=4)[0]
+        return self._format_job_context(job_description, self._of_type(results, "job_description"))
     
     def get_scoring_rubric_context(self, evaluation_type: str) -> str:
         """Get relevant scoring rubric for evaluation type"""
-        results = self.search_relevant_context(
-            query=f"{evaluation_type} evaluation scoring",
-            context_type="scoring_rubric",
-            n_results=2
-        )
-        
-        if not results:
-            return "Use standard evaluation criteria."
-        
-        context = "Scoring Guidelines:\n"
-        for result in results:
-            context += f"{result['content']}\n\n"
-        
-        return context
+        results = self.search_multi([f"{evaluation_type} evaluation scoring"], n_results=4)[0]
+        return self._format_rubric_context(self._of_type(results, "scoring_rubric"))
     
     def health_check(self) -> Dict[str, Any]:
         """Check vector database health"""
@@ -240,5 +332,14 @@ class VectorService:
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
 
-# Global instance
-vector_service = VectorService()
\ No newline at end of file
+# Lazily built process-wide instance. VectorService.__init__ opens the
+# Chroma persistence dir, loads the embedding model, and seeds default
+# documents - far too heavy to run as an import side effect.
+_vector_service: Optional[VectorService] = None
+
+def get_vector_service() -> VectorService:
+    """Return the shared VectorService, building it on first use"""
+    global _vector_service
+    if _vector_service is None:
+        _vector_service = VectorService()
+    return _vector_service
\ No newline at end of file
@@ -1,8 +1,10 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
-import logging
+import logging.config
 
 from app.routers import upload, evaluation, results
 from app.core.exceptions import (
@@ -14,18 +16,54 @@ from app.core.exceptions import (
 )
 from app.core.config import settings
 
+# Configure logging once for the whole app; modules only call getLogger.
+# disable_existing_loggers=False keeps loggers created before this runs alive
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "default"
+        }
+    },
+    "root": {
+        "level": "INFO",
+        "handlers": ["console"]
+    }
+})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the heavyweight services once per process at startup.
+
+    The services themselves are lazy singletons, so `import main` stays
+    cheap (uvicorn --reload, test collection); building them here means
+    the first request never pays Chroma/SDK initialization cost.
+    """
+    from app.services.vector_service import get_vector_service
+    from app.services.llm_service import get_llm_service
+    from app.services.file_service import get_file_service
+    from app.services.evaluation_service import get_evaluation_service
+
+    get_vector_service()
+    get_llm_service()
+    get_file_service()
+    get_evaluation_service().start_background_sweeper()
+    yield
+
 app = FastAPI(
     title="Candidate Evaluation Backend",
     description="AI-powered candidate evaluation system using LLM and vector database",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
-)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
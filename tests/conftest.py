@@ -1,96 +1,170 @@
+import copy
 import pytest
-import tempfile
+import shutil
 import os
-from pathlib import Path
+from types import MappingProxyType
 import httpx
-from unittest.mock import Mock, patch
-import asyncio
+from unittest.mock import Mock
 
-from app.core.config import settings
 from main import app
+from tests.fixtures._constants import (
+    MINIMAL_DOCX_BYTES, MINIMAL_PDF_BYTES, SAMPLE_TXT_BYTES
+)
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_collection_modifyitems(config, items):
+    """Mark every test with its suite (unit/integration/e2e) by directory.
 
+    Selection like `pytest -m "not integration"` then works for fast local
+    cycles without relying on each method carrying its own decorator.
+    """
+    for item in items:
+        path = str(item.fspath)
+        for suite in ("unit", "integration", "e2e"):
+            if f"{os.sep}tests{os.sep}{suite}{os.sep}" in path:
+                item.add_marker(getattr(pytest.mark, suite))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
+    """Single test client shared across the session.
+
+    TestClient spins up a portal and drives the ASGI lifespan on entry;
+    doing that once per run instead of once per test keeps route-level
+    tests dominated by the request itself, not client construction.
+    """
     from fastapi.testclient import TestClient
-    return TestClient(app)
+    with TestClient(app) as c:
+        yield c
+    # Safety net: fixtures that install dependency overrides remove their
+    # own, but a stray override must not leak past the session either.
+    app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def temp_upload_dir():
-    """Create a temporary directory for file uploads during testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_upload_dir = settings.UPLOAD_DIR
-        settings.UPLOAD_DIR = temp_dir
-        yield temp_dir
-        settings.UPLOAD_DIR = original_upload_dir
+@pytest.fixture(scope="session")
+async def aclient():
+    """Session-wide async client driving the app in-process.
+
+    ASGITransport invokes the app directly on the shared session event
+    loop, so async endpoint tests skip the portal-thread hop the sync
+    TestClient pays per request.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture(scope="session", autouse=True)
+def temp_upload_dir(tmp_path_factory):
+    """Session upload directory, wired into the app via dependency override.
+
+    Autouse and session-scoped: every endpoint test's uploads land in a
+    pytest-managed tmp dir instead of piling up in the repo's shared
+    uploads/ directory, including uploads made from module-scoped fixtures
+    that run before any function-scoped fixture could install the override.
+    Overriding get_upload_dir instead of mutating settings.UPLOAD_DIR keeps
+    parallel (pytest-xdist) workers from racing on the shared settings
+    object; direct FileService unit tests receive the dir explicitly.
+    """
+    from app.routers.upload import get_upload_dir
+
+    temp_dir = str(tmp_path_factory.mktemp("uploads"))
+    app.dependency_overrides[get_upload_dir] = lambda: temp_dir
+    yield temp_dir
+    app.dependency_overrides.pop(get_upload_dir, None)
+
+
+# Sample file content is written once per session into a template directory;
+# per-test fixtures hand out cheap copies under tmp_path, which pytest cleans
+# up on its own - no manual os.unlink bookkeeping. The byte payloads live in
+# tests/fixtures/_constants.py, shared with the mock_files helpers. Cross-run
+# fixture caching (e.g. pytest-fixture-cache) was considered and rejected:
+# the payloads are in-memory constants, so there is no generation cost left
+# for a persistent cache to amortize.
+@pytest.fixture(scope="session")
+def _sample_templates(tmp_path_factory):
+    """Write each sample file once for the whole session."""
+    samples = tmp_path_factory.mktemp("samples")
+    (samples / "sample.pdf").write_bytes(MINIMAL_PDF_BYTES)
+    (samples / "sample.txt").write_bytes(SAMPLE_TXT_BYTES)
+    (samples / "sample.docx").write_bytes(MINIMAL_DOCX_BYTES)
+    return samples
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_bytes():
+    """Sample PDF payload for in-memory multipart uploads.
+
+    Route-level tests don't need a file on disk at all: posting BytesIO
+    copies of one shared byte string skips the open/read/close per test.
+    """
+    return MINIMAL_PDF_BYTES
+
+
+@pytest.fixture(scope="session")
+def sample_txt_bytes():
+    """Sample TXT payload for in-memory multipart uploads."""
+    return SAMPLE_TXT_BYTES
+
+
+# httpx accepts raw bytes as multipart content, so these mappings are built
+# once per session and shared read-only by every upload call.
+@pytest.fixture(scope="session")
+def cv_files(sample_pdf_bytes):
+    """Ready-made multipart mapping for a CV upload."""
+    return {"file": ("cv.pdf", sample_pdf_bytes, "application/pdf")}
+
+
+@pytest.fixture(scope="session")
+def project_files(sample_txt_bytes):
+    """Ready-made multipart mapping for a project-report upload."""
+    return {"file": ("project.txt", sample_txt_bytes, "text/plain")}
+
+
+@pytest.fixture(scope="session")
+def oversized_bytes():
+    """One 11MB buffer, just over the 10MB limit, allocated once per session.
+
+    Tests wrap it in BytesIO for a private read cursor; BytesIO shares
+    the underlying bytes object, so no copy is made.
+    """
+    return b"x" * (11 * 1024 * 1024)
 
 
 @pytest.fixture
-def sample_pdf_file():
-    """Create a sample PDF file for testing."""
-    content = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n>>\nendobj\nxref\n0 4\n0000000000 65535 f \n0000000009 00000 n \n0000000074 00000 n \n0000000120 00000 n \ntrailer\n<<\n/Size 4\n/Root 1 0 R\n>>\nstartxref\n178\n%%EOF"
-    
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-        temp_file.write(content)
-        temp_file.flush()
-        yield temp_file.name
-    
-    # Clean up the temporary file
-    try:
-        os.unlink(temp_file.name)
-    except FileNotFoundError:
-        pass
+def sample_pdf_file(_sample_templates, tmp_path):
+    """Per-test copy of the sample PDF file."""
+    return str(shutil.copy(_sample_templates / "sample.pdf", tmp_path / "sample.pdf"))
 
 
 @pytest.fixture
-def sample_txt_file():
-    """Create a sample text file for testing."""
-    content = b"This is a sample CV content.\nName: John Doe\nExperience: 5 years in software development."
-    
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as temp_file:
-        temp_file.write(content)
-        temp_file.flush()
-        yield temp_file.name
-    
-    # Clean up the temporary file
-    try:
-        os.unlink(temp_file.name)
-    except FileNotFoundError:
-        pass
+def sample_txt_file(_sample_templates, tmp_path):
+    """Per-test copy of the sample text file."""
+    return str(shutil.copy(_sample_templates / "sample.txt", tmp_path / "sample.txt"))
 
 
 @pytest.fixture
-def sample_docx_file():
-    """Create a sample DOCX file for testing."""
-    # Minimal DOCX structure
-    content = b"PK\x03\x04\x14\x00\x00\x00\x08\x00"
-    
-    with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as temp_file:
-        temp_file.write(content)
-        temp_file.flush()
-        yield temp_file.name
-    
-    # Clean up the temporary file
-    try:
-        os.unlink(temp_file.name)
-    except FileNotFoundError:
-        pass
+def sample_docx_file(_sample_templates, tmp_path):
+    """Per-test copy of the sample DOCX file."""
+    return str(shutil.copy(_sample_templates / "sample.docx", tmp_path / "sample.docx"))
 
 
 @pytest.fixture
+def tempfiles(tmp_path):
+    """Factory for mock files that live under the test's tmp_path."""
+    from tests.fixtures.mock_files import TempFileMaker
+    return TempFileMaker(tmp_path)
+
+
+@pytest.fixture(scope="session")
 def mock_llm_response():
-    """Mock LLM response for testing."""
-    return {
+    """Mock LLM response for testing.
+
+    Session-scoped and wrapped in MappingProxyType: the dict is only ever
+    read, so one shared immutable view replaces a per-test rebuild.
+    """
+    return MappingProxyType({
         "technical_skills": {
             "score": 85,
             "feedback": "Strong technical background in Python and web development"
@@ -107,12 +181,16 @@ def mock_llm_response():
         "recommendation": "Recommended for interview",
         "strengths": ["Technical skills", "Problem solving"],
         "areas_for_improvement": ["Communication skills"]
-    }
+    })
 
 
-@pytest.fixture
-def mock_openai_client():
-    """Mock OpenAI client for testing."""
+# The mock client trees below are configured once per session; per-test
+# fixtures hand out copy.copy snapshots. The copies share child mocks, which
+# is fine as long as tests only call them - a test that reconfigures
+# return_value/side_effect should build its own Mock instead.
+@pytest.fixture(scope="session")
+def _openai_client_prototype():
+    """Session-wide template for the mock OpenAI client."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.choices = [Mock()]
@@ -122,8 +200,14 @@ def mock_openai_client():
 
 
 @pytest.fixture
-def mock_gemini_client():
-    """Mock Gemini client for testing."""
+def mock_openai_client(_openai_client_prototype):
+    """Mock OpenAI client for testing."""
+    return copy.copy(_openai_client_prototype)
+
+
+@pytest.fixture(scope="session")
+def _gemini_client_prototype():
+    """Session-wide template for the mock Gemini client."""
     mock_client = Mock()
     mock_response = Mock()
     mock_response.text = '{"overall_score": 75, "recommendation": "Consider for interview"}'
@@ -131,27 +215,23 @@ def mock_gemini_client():
     return mock_client
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
+def mock_gemini_client(_gemini_client_prototype):
+    """Mock Gemini client for testing."""
+    return copy.copy(_gemini_client_prototype)
+
+
+@pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
-    """Setup test environment variables."""
-    original_env = {}
-    test_env = {
-        "OPENAI_API_KEY": "test_openai_key",
-        "GEMINI_API_KEY": "test_gemini_key",
-        "DEFAULT_LLM_PROVIDER": "mock",
-        "DEBUG": "true"
-    }
-    
-    # Store original values
-    for key in test_env:
-        original_env[key] = os.environ.get(key)
-        os.environ[key] = test_env[key]
-    
+    """Setup test environment variables once for the whole session.
+
+    Nothing in the suite mutates these keys, so the swap/restore dance
+    doesn't need to run around every single test.
+    """
+    mp = pytest.MonkeyPatch()
+    mp.setenv("OPENAI_API_KEY", "test_openai_key")
+    mp.setenv("GEMINI_API_KEY", "test_gemini_key")
+    mp.setenv("DEFAULT_LLM_PROVIDER", "mock")
+    mp.setenv("DEBUG", "true")
     yield
-    
-    # Restore original values
-    for key, value in original_env.items():
-        if value is None:
-            os.environ.pop(key, None)
-        else:
-            os.environ[key] = value
\ No newline at end of file
+    mp.undo()
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Shared byte constants for mock/sample test files.
+
+Single source of truth for the minimal file payloads used by both the
+conftest fixtures and the mock_files helpers, so the literals are parsed
+once and never drift apart.
+"""
+
+# Minimal but structurally valid single-page PDF; enough for any test that
+# checks magic bytes or upload acceptance without reading the text back
+MINIMAL_PDF_BYTES: bytes = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n>>\nendobj\nxref\n0 4\n0000000000 65535 f \n0000000009 00000 n \n0000000074 00000 n \n0000000120 00000 n \ntrailer\n<<\n/Size 4\n/Root 1 0 R\n>>\nstartxref\n178\n%%EOF"
+
+# Just the ZIP local-file-header magic - looks like a DOCX to extension and
+# magic-byte checks without being a parseable document
+MINIMAL_DOCX_BYTES: bytes = b"PK\x03\x04\x14\x00\x00\x00\x08\x00"
+
+SAMPLE_TXT_BYTES: bytes = b"This is a sample CV content.\nName: John Doe\nExperience: 5 years in software development."
+
+# Route paths exercised across the integration and e2e suites
+CV_UPLOAD_URL = "/api/v1/upload/cv"
+PROJECT_UPLOAD_URL = "/api/v1/upload/project"
+EVALUATE_URL = "/api/v1/evaluate"
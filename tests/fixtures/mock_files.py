@@ -1,17 +1,14 @@
 """Utilities for creating mock files for testing."""
 
+import functools
+import itertools
 import tempfile
 import os
 from pathlib import Path
 from typing import BinaryIO
 import io
 
-# Try to import docx for creating DOCX files
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+from ._constants import MINIMAL_PDF_BYTES
 
 # Try to import reportlab for creating PDF files
 try:
@@ -25,112 +22,137 @@ except ImportError:
 def create_sample_txt_file(content: str = None) -> str:
     """Create a temporary TXT file with sample content."""
     if content is None:
-        from .sample_data import SAMPLE_CV_TEXT
-        content = SAMPLE_CV_TEXT
+        from .sample_data import get_sample_cv_text
+        content = get_sample_cv_text()
     
     with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
         f.write(content)
         return f.name
 
 
-def create_sample_pdf_file(content: str = None) -> str:
-    """Create a temporary PDF file with sample content."""
+def _render_pdf_bytes(content: str) -> bytes:
+    """Render content into PDF bytes with reportlab."""
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
+    width, height = letter
+
+    # Split content into lines and add to PDF
+    lines = content.split('\n')
+    y_position = height - 50
+
+    for line in lines:
+        if y_position < 50:  # Start new page if needed
+            c.showPage()
+            y_position = height - 50
+
+        # Truncate long lines to fit page width
+        if len(line) > 80:
+            line = line[:77] + "..."
+
+        c.drawString(50, y_position, line)
+        y_position -= 15
+
+    c.save()
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_pdf_bytes() -> bytes:
+    """Render the default sample CV PDF once; canvas rendering dominates
+    the cost of every PDF fixture, so callers reuse these bytes."""
+    from .sample_data import get_sample_cv_text
+    return _render_pdf_bytes(get_sample_cv_text())
+
+
+def create_sample_pdf_file(content: str = None, render: bool = False) -> str:
+    """Create a temporary PDF file with sample content.
+
+    Pass render=True when the test will read text back out of the PDF;
+    the default returns a minimal hand-crafted PDF without paying for a
+    reportlab layout pass.
+    """
+    if content is None and not render:
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            f.write(MINIMAL_PDF_BYTES)
+            return f.name
+
     if not PDF_AVAILABLE:
         # Fallback: create a simple PDF-like file
         return create_mock_pdf_file(content)
-    
-    if content is None:
-        from .sample_data import SAMPLE_CV_TEXT
-        content = SAMPLE_CV_TEXT
-    
+
+    pdf_bytes = _default_pdf_bytes() if content is None else _render_pdf_bytes(content)
     with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
-        # Create a simple PDF with reportlab
-        c = canvas.Canvas(f.name, pagesize=letter)
-        width, height = letter
-        
-        # Split content into lines and add to PDF
-        lines = content.split('\n')
-        y_position = height - 50
-        
-        for line in lines:
-            if y_position < 50:  # Start new page if needed
-                c.showPage()
-                y_position = height - 50
-            
-            # Truncate long lines to fit page width
-            if len(line) > 80:
-                line = line[:77] + "..."
-            
-            c.drawString(50, y_position, line)
-            y_position -= 15
-        
-        c.save()
+        f.write(pdf_bytes)
         return f.name
 
 
 def create_mock_pdf_file(content: str = None) -> str:
     """Create a mock PDF file (simple text file with .pdf extension)."""
-    if content is None:
-        content = "%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n\nSample PDF content for testing"
-    
     with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
-        f.write(content.encode('utf-8'))
+        f.write(MINIMAL_PDF_BYTES if content is None else content.encode('utf-8'))
         return f.name
 
 
 def create_sample_docx_file(content: str = None) -> str:
-    """Create a temporary DOCX file with sample content."""
-    if not DOCX_AVAILABLE:
-        # Fallback: create a simple DOCX-like file
-        return create_mock_docx_file(content)
-    
+    """Create a temporary DOCX file with sample content.
+
+    Always uses the minimal cached ZIP template - the suite only checks
+    upload acceptance and text extraction, neither of which needs the
+    full python-docx serialization path.
+    """
     if content is None:
-        from .sample_data import SAMPLE_PROJECT_TEXT
-        content = SAMPLE_PROJECT_TEXT
-    
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-        doc = Document()
-        
-        # Split content into paragraphs and add to document
-        paragraphs = content.split('\n\n')
-        for paragraph in paragraphs:
-            if paragraph.strip():
-                doc.add_paragraph(paragraph.strip())
-        
-        doc.save(f.name)
-        return f.name
+        from .sample_data import get_sample_project_text
+        content = get_sample_project_text()
+    return create_mock_docx_file(content)
 
 
-def create_mock_docx_file(content: str = None) -> str:
-    """Create a mock DOCX file (ZIP-like structure)."""
-    if content is None:
-        content = "Mock DOCX content for testing"
-    
-    # Create a simple ZIP-like file that mimics DOCX structure
-    import zipfile
-    
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-        with zipfile.ZipFile(f.name, 'w') as docx:
-            # Add minimal DOCX structure
-            docx.writestr('[Content_Types].xml', '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+# Pre-serialized DOCX parts: the two fixed entries are byte constants and
+# only word/document.xml is formatted per content string
+_CT_XML = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
 <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
 <Default Extension="xml" ContentType="application/xml"/>
 <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
-</Types>''')
-            
-            docx.writestr('_rels/.rels', '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+</Types>'''
+
+_RELS_XML = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
 <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
-</Relationships>''')
-            
-            docx.writestr('word/document.xml', f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+</Relationships>'''
+
+_DOC_XML_TMPL = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
 <w:body>
 <w:p><w:r><w:t>{content}</w:t></w:r></w:p>
 </w:body>
-</w:document>''')
-        
+</w:document>'''
+
+
+@functools.lru_cache(maxsize=None)
+def _docx_template_bytes(content: str) -> bytes:
+    """Build the minimal three-entry DOCX ZIP once per distinct content.
+
+    ZIP_STORED skips zlib compression - these files exist to be parsed by
+    tests, not stored.
+    """
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_STORED) as docx:
+        # Add minimal DOCX structure
+        docx.writestr('[Content_Types].xml', _CT_XML)
+        docx.writestr('_rels/.rels', _RELS_XML)
+        docx.writestr('word/document.xml', _DOC_XML_TMPL.format(content=content).encode())
+    return buf.getvalue()
+
+
+def create_mock_docx_file(content: str = None) -> str:
+    """Create a mock DOCX file (ZIP-like structure)."""
+    if content is None:
+        content = "Mock DOCX content for testing"
+
+    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
+        f.write(_docx_template_bytes(content))
         return f.name
 
 
@@ -151,13 +173,10 @@ def create_empty_file(extension: str = '.pdf') -> str:
 def create_large_file(size_mb: int = 15, extension: str = '.pdf') -> str:
     """Create a large file for testing size limits."""
     with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as f:
-        # Write specified amount of data
-        chunk_size = 1024 * 1024  # 1MB chunks
-        data = b'x' * chunk_size
-        
-        for _ in range(size_mb):
-            f.write(data)
-        
+        # Only the size matters to the limit checks; ftruncate produces a
+        # sparse file of the right length instantly instead of writing
+        # size_mb megabytes of padding
+        os.ftruncate(f.fileno(), size_mb * 1024 * 1024)
         return f.name
 
 
@@ -166,83 +185,88 @@ def create_binary_file_object(content: bytes, filename: str = "test.pdf") -> Bin
     return io.BytesIO(content)
 
 
-def cleanup_temp_file(file_path: str) -> None:
-    """Clean up a temporary file."""
-    try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-    except OSError:
-        pass  # Ignore cleanup errors
+class TempFileMaker:
+    """Creates mock files inside a pytest-managed directory.
 
+    Replaces the old TempFileManager context manager: everything lands
+    under the test's tmp_path, so pytest's rotation policy cleans up and
+    no unlink bookkeeping is needed. Used through the `tempfiles` fixture.
+    """
 
-def cleanup_temp_files(file_paths: list) -> None:
-    """Clean up multiple temporary files."""
-    for file_path in file_paths:
-        cleanup_temp_file(file_path)
+    def __init__(self, base):
+        self.base = Path(base)
+        self._counter = itertools.count()
 
+    def _path(self, suffix: str) -> Path:
+        return self.base / f"mock_{next(self._counter)}{suffix}"
 
-class TempFileManager:
-    """Context manager for handling temporary files."""
-    
-    def __init__(self):
-        self.temp_files = []
-    
-    def create_txt_file(self, content: str = None) -> str:
-        """Create and track a temporary TXT file."""
-        file_path = create_sample_txt_file(content)
-        self.temp_files.append(file_path)
-        return file_path
-    
-    def create_pdf_file(self, content: str = None) -> str:
-        """Create and track a temporary PDF file."""
-        file_path = create_sample_pdf_file(content)
-        self.temp_files.append(file_path)
-        return file_path
-    
-    def create_docx_file(self, content: str = None) -> str:
-        """Create and track a temporary DOCX file."""
-        file_path = create_sample_docx_file(content)
-        self.temp_files.append(file_path)
-        return file_path
-    
-    def create_invalid_file(self, extension: str = '.xyz') -> str:
-        """Create and track an invalid file."""
-        file_path = create_invalid_file(extension)
-        self.temp_files.append(file_path)
-        return file_path
-    
-    def create_large_file(self, size_mb: int = 15, extension: str = '.pdf') -> str:
-        """Create and track a large file."""
-        file_path = create_large_file(size_mb, extension)
-        self.temp_files.append(file_path)
-        return file_path
-    
-    def __enter__(self):
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Clean up all tracked temporary files."""
-        cleanup_temp_files(self.temp_files)
-        self.temp_files.clear()
+    def txt(self, content: str = None) -> str:
+        """Create a TXT file with sample content."""
+        if content is None:
+            from .sample_data import get_sample_cv_text
+            content = get_sample_cv_text()
+        path = self._path('.txt')
+        path.write_text(content)
+        return str(path)
+
+    def pdf(self, content: str = None) -> str:
+        """Create a PDF file with sample content."""
+        path = self._path('.pdf')
+        if PDF_AVAILABLE:
+            path.write_bytes(
+                _default_pdf_bytes() if content is None else _render_pdf_bytes(content)
+            )
+        else:
+            path.write_bytes(
+                MINIMAL_PDF_BYTES if content is None else content.encode('utf-8')
+            )
+        return str(path)
+
+    def docx(self, content: str = None) -> str:
+        """Create a minimal DOCX file with sample content."""
+        path = self._path('.docx')
+        path.write_bytes(_docx_template_bytes(content or "Mock DOCX content for testing"))
+        return str(path)
+
+    def invalid(self, extension: str = '.xyz') -> str:
+        """Create a file with an invalid extension."""
+        path = self._path(extension)
+        path.write_bytes(b"This is an invalid file for testing")
+        return str(path)
+
+    def empty(self, extension: str = '.pdf') -> str:
+        """Create an empty file."""
+        path = self._path(extension)
+        path.touch()
+        return str(path)
+
+    def large(self, size_mb: int = 15, extension: str = '.pdf') -> str:
+        """Create a sparse file exceeding the upload size limit."""
+        path = self._path(extension)
+        path.touch()
+        os.truncate(path, size_mb * 1024 * 1024)
+        return str(path)
 
 
-# Convenience functions for common test scenarios
+# Convenience functions for common test scenarios. Both return zero-arg
+# callables rather than paths: a test pays only for the scenarios it calls,
+# not for eagerly creating every file (including the 15 MiB one) up front.
 def get_sample_files_dict():
-    """Get a dictionary of sample files for testing."""
+    """Get a dictionary of sample file factories for testing."""
     return {
-        'pdf': create_sample_pdf_file(),
-        'txt': create_sample_txt_file(),
-        'docx': create_sample_docx_file()
+        'pdf': create_sample_pdf_file,
+        'txt': create_sample_txt_file,
+        'docx': create_sample_docx_file
     }
 
 
 def get_test_file_scenarios():
-    """Get various file scenarios for comprehensive testing."""
+    """Get factories for various file scenarios for comprehensive testing."""
     return {
-        'valid_pdf': create_sample_pdf_file(),
-        'valid_txt': create_sample_txt_file(),
-        'valid_docx': create_sample_docx_file(),
-        'invalid_extension': create_invalid_file('.xyz'),
-        'empty_file': create_empty_file('.pdf'),
-        'large_file': create_large_file(15, '.pdf')
+        'valid_pdf': create_sample_pdf_file,
+        'valid_txt': create_sample_txt_file,
+        'valid_docx': create_sample_docx_file,
+        'invalid_extension': lambda: create_invalid_file('.xyz'),
+        'empty_file': lambda: create_empty_file('.pdf'),
+        'large_file': lambda: create_large_file(15, '.pdf')
     }
\ No newline at end of file
@@ -1,66 +1,142 @@
 """Integration tests for evaluation endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock, MagicMock
-import json
+import httpx
+from unittest.mock import AsyncMock
 import asyncio
 
+import orjson
+
+from tests.fixtures._constants import CV_UPLOAD_URL, EVALUATE_URL, PROJECT_UPLOAD_URL
+
+
+# Static request bodies are serialized once at import; httpx would otherwise
+# re-run stdlib json.dumps on the same dict for every call. Dynamic bodies
+# below go through orjson per test for the same reason.
+_JSON_HDR = {"content-type": "application/json"}
+
+# Acceptable status sets for the loosely specified endpoints; frozensets
+# give an O(1) membership check without a fresh list per assertion
+_OK_OR_NOT_FOUND = frozenset({200, 404})
+_TIMEOUT_STATUSES = frozenset({200, 408, 500})
+_INVALID_ID_BODY = orjson.dumps({
+    "cv_file_id": "invalid-file-id",
+    "job_description": "Software Engineer position"
+})
+_MISSING_ID_BODY = orjson.dumps({"job_description": "Software Engineer position"})
+
+# The parametrized scenario bodies are serialized once at import with a
+# sentinel where the uploaded file id goes; a byte-level replace at test
+# time is cheaper than re-encoding the dict per case.
+_FILE_ID_SENTINEL = b"<FILE_ID>"
+
+
+def _scenario_body(job_description: str) -> bytes:
+    return orjson.dumps({
+        "cv_file_id": _FILE_ID_SENTINEL.decode(),
+        "job_description": job_description
+    })
+
+# Mock LLM payloads for the parametrized evaluate scenarios
+_EVAL_SUCCESS_RESPONSE = {
+    "overall_score": 85,
+    "technical_skills": {
+        "score": 90,
+        "strengths": ["Python", "FastAPI", "Machine Learning"],
+        "areas_for_improvement": ["DevOps", "System Design"]
+    },
+    "experience": {
+        "score": 80,
+        "years_of_experience": 5,
+        "relevant_experience": "Strong backend development experience"
+    },
+    "education": {
+        "score": 85,
+        "degree": "Computer Science",
+        "certifications": ["AWS Certified Developer"]
+    },
+    "soft_skills": {
+        "score": 75,
+        "communication": "Good",
+        "leadership": "Developing"
+    },
+    "recommendations": [
+        "Consider gaining more DevOps experience",
+        "Strengthen system design knowledge"
+    ]
+}
+
+_EVAL_CUSTOM_CRITERIA_RESPONSE = {
+    "overall_score": 88,
+    "custom_criteria": {
+        "leadership": 85,
+        "innovation": 90,
+        "teamwork": 80
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_llm(monkeypatch):
+    """Swap LLMService.evaluate_cv for an AsyncMock on every test.
+
+    One monkeypatch.setattr per test replaces the heavier per-method
+    unittest.mock.patch decorators, which re-resolve the patch target
+    through the import system on every enter/exit.
+    """
+    m = AsyncMock()
+    monkeypatch.setattr("app.services.llm_service.LLMService.evaluate_cv", m)
+    return m
+
+
+@pytest.fixture(scope="module")
+async def uploaded_cv_file_id(aclient, cv_files):
+    """Upload the sample CV once for the whole module.
+
+    The evaluate endpoint only reads the referenced file, so every test
+    can share one file_id instead of paying an upload round trip each.
+    """
+    response = await aclient.post(CV_UPLOAD_URL, files=cv_files)
+    assert response.status_code == 200
+    return response.json()["file_id"]
+
 
 class TestEvaluationEndpoints:
     """Test class for evaluation endpoints integration tests."""
 
     @pytest.mark.integration
-    @patch('app.services.llm_service.LLMService.evaluate_cv')
-    def test_evaluate_cv_success(self, mock_evaluate_cv, client: TestClient, sample_pdf_file):
-        """Test successful CV evaluation."""
-        # Mock LLM response
-        mock_response = {
-            "overall_score": 85,
-            "technical_skills": {
-                "score": 90,
-                "strengths": ["Python", "FastAPI", "Machine Learning"],
-                "areas_for_improvement": ["DevOps", "System Design"]
-            },
-            "experience": {
-                "score": 80,
-                "years_of_experience": 5,
-                "relevant_experience": "Strong backend development experience"
-            },
-            "education": {
-                "score": 85,
-                "degree": "Computer Science",
-                "certifications": ["AWS Certified Developer"]
-            },
-            "soft_skills": {
-                "score": 75,
-                "communication": "Good",
-                "leadership": "Developing"
-            },
-            "recommendations": [
-                "Consider gaining more DevOps experience",
-                "Strengthen system design knowledge"
-            ]
-        }
-        mock_evaluate_cv.return_value = mock_response
-
-        # First upload a CV
-        with open(sample_pdf_file, "rb") as f:
-            upload_response = client.post(
-                "/api/v1/upload/cv",
-                files={"file": ("cv.pdf", f, "application/pdf")}
-            )
-        
-        assert upload_response.status_code == 200
-        file_id = upload_response.json()["file_id"]
-
-        # Then evaluate the CV
-        evaluation_response = client.post(
-            "/api/v1/evaluate",
-            json={
-                "cv_file_id": file_id,
-                "job_description": "Software Engineer position requiring Python and FastAPI experience"
-            }
+    @pytest.mark.parametrize("mock_behavior, body_template", [
+        pytest.param(
+            {"return_value": _EVAL_SUCCESS_RESPONSE},
+            _scenario_body("Software Engineer position requiring Python and FastAPI experience"),
+            id="success"),
+        pytest.param(
+            {"return_value": _EVAL_CUSTOM_CRITERIA_RESPONSE},
+            _scenario_body("Software Engineer position requiring Python and FastAPI experience with leadership skills"),
+            id="custom-criteria"),
+        pytest.param(
+            {"return_value": "Invalid JSON response"},
+            _scenario_body("Software Engineer position"),
+            id="invalid-json"),
+        pytest.param(
+            {"side_effect": Exception("LLM service error")},
+            _scenario_body("Software Engineer position"),
+            id="llm-error"),
+    ])
+    async def test_evaluate_cv_scenarios(self, mock_llm, aclient: httpx.AsyncClient,
+                                   uploaded_cv_file_id, mock_behavior, body_template):
+        """Evaluation request is accepted regardless of how the LLM call behaves.
+
+        The endpoint queues a background job, so a clean result, a junk
+        response, and an outright LLM failure all surface identically as
+        a queued job; only the mocked behavior and job description vary.
+        """
+        mock_llm.configure_mock(**mock_behavior)
+
+        evaluation_response = await aclient.post(
+            EVALUATE_URL,
+            content=body_template.replace(_FILE_ID_SENTINEL, uploaded_cv_file_id.encode()),
+            headers=_JSON_HDR
         )
 
         assert evaluation_response.status_code == 200
@@ -70,8 +146,7 @@ class TestEvaluationEndpoints:
         assert "message" in data
 
     @pytest.mark.integration
-    @patch('app.services.llm_service.LLMService.evaluate_cv')
-    def test_evaluate_cv_with_project(self, mock_evaluate_cv, client: TestClient, sample_pdf_file, sample_txt_file):
+    async def test_evaluate_cv_with_project(self, mock_llm, aclient: httpx.AsyncClient, uploaded_cv_file_id, project_files):
         """Test CV evaluation with project report."""
         # Mock LLM response
         mock_response = {
@@ -86,32 +161,23 @@ class TestEvaluationEndpoints:
                 "innovation": "Good"
             }
         }
-        mock_evaluate_cv.return_value = mock_response
+        mock_llm.return_value = mock_response
 
-        # Upload CV
-        with open(sample_pdf_file, "rb") as f:
-            cv_response = client.post(
-                "/api/v1/upload/cv",
-                files={"file": ("cv.pdf", f, "application/pdf")}
-            )
-        cv_file_id = cv_response.json()["file_id"]
+        cv_file_id = uploaded_cv_file_id
 
         # Upload project report
-        with open(sample_txt_file, "rb") as f:
-            project_response = client.post(
-                "/api/v1/upload/project",
-                files={"file": ("project.txt", f, "text/plain")}
-            )
+        project_response = await aclient.post(PROJECT_UPLOAD_URL, files=project_files)
         project_file_id = project_response.json()["file_id"]
 
         # Evaluate with both files
-        evaluation_response = client.post(
-            "/api/v1/evaluate",
-            json={
+        evaluation_response = await aclient.post(
+            EVALUATE_URL,
+            content=orjson.dumps({
                 "cv_file_id": cv_file_id,
                 "project_report_file_id": project_file_id,
                 "job_description": "Software Engineer position requiring Python and FastAPI experience"
-            }
+            }),
+            headers=_JSON_HDR
         )
 
         assert evaluation_response.status_code == 200
@@ -121,14 +187,10 @@ class TestEvaluationEndpoints:
         assert "message" in data
 
     @pytest.mark.integration
-    def test_evaluate_cv_invalid_file_id(self, client: TestClient):
+    async def test_evaluate_cv_invalid_file_id(self, aclient: httpx.AsyncClient):
         """Test CV evaluation with invalid file ID."""
-        response = client.post(
-            "/api/v1/evaluate",
-            json={
-                "cv_file_id": "invalid-file-id",
-                "job_description": "Software Engineer position"
-            }
+        response = await aclient.post(
+            EVALUATE_URL, content=_INVALID_ID_BODY, headers=_JSON_HDR
         )
 
         # The API accepts the request and returns a job ID
@@ -142,80 +204,19 @@ class TestEvaluationEndpoints:
         # In a real test, you might want to check the job status after some time
 
     @pytest.mark.integration
-    def test_evaluate_cv_missing_file_id(self, client: TestClient):
+    async def test_evaluate_cv_missing_file_id(self, aclient: httpx.AsyncClient):
         """Test CV evaluation without file ID."""
-        response = client.post(
-            "/api/v1/evaluate",
-            json={"job_description": "Software Engineer position"}
+        response = await aclient.post(
+            EVALUATE_URL, content=_MISSING_ID_BODY, headers=_JSON_HDR
         )
 
-        # The API should return 400 for missing required fields
-        assert response.status_code == 400
+        # Model-level validation rejects the payload with FastAPI's 422
+        assert response.status_code == 422
         data = response.json()
         assert "detail" in data
 
     @pytest.mark.integration
-    @patch('app.services.llm_service.LLMService.evaluate_cv')
-    def test_evaluate_cv_llm_service_error(self, mock_evaluate_cv, client: TestClient, sample_pdf_file):
-        """Test CV evaluation when LLM service raises an error."""
-        mock_evaluate_cv.side_effect = Exception("LLM service error")
-
-        # Upload CV first
-        with open(sample_pdf_file, "rb") as f:
-            upload_response = client.post(
-                "/api/v1/upload/cv",
-                files={"file": ("cv.pdf", f, "application/pdf")}
-            )
-        file_id = upload_response.json()["file_id"]
-
-        # Attempt evaluation
-        evaluation_response = client.post(
-            "/api/v1/evaluate",
-            json={
-                "cv_file_id": file_id,
-                "job_description": "Software Engineer position"
-            }
-        )
-
-        # The API accepts the request even if LLM service will fail
-        assert evaluation_response.status_code == 200
-        data = evaluation_response.json()
-        assert "id" in data
-        assert "status" in data
-        assert "message" in data
-
-    @pytest.mark.integration
-    @patch('app.services.llm_service.LLMService.evaluate_cv')
-    def test_evaluate_cv_invalid_json_response(self, mock_evaluate_cv, client: TestClient, sample_pdf_file):
-        """Test CV evaluation when LLM returns invalid JSON."""
-        mock_evaluate_cv.return_value = "Invalid JSON response"
-
-        # Upload CV first
-        with open(sample_pdf_file, "rb") as f:
-            upload_response = client.post(
-                "/api/v1/upload/cv",
-                files={"file": ("cv.pdf", f, "application/pdf")}
-            )
-        file_id = upload_response.json()["file_id"]
-
-        # Attempt evaluation
-        evaluation_response = client.post(
-            "/api/v1/evaluate",
-            json={
-                "cv_file_id": file_id,
-                "job_description": "Software Engineer position"
-            }
-        )
-
-        # The API accepts the request even if LLM returns invalid JSON
-        assert evaluation_response.status_code == 200
-        data = evaluation_response.json()
-        assert "id" in data
-        assert "status" in data
-        assert "message" in data
-
-    @pytest.mark.integration
-    def test_get_evaluation_results_success(self, client: TestClient):
+    async def test_get_evaluation_results_success(self, aclient: httpx.AsyncClient):
         """Test retrieving evaluation results."""
         # This test assumes there's a GET endpoint for evaluation results
         # Since it's not implemented yet, we'll test the expected behavior
@@ -223,84 +224,38 @@ class TestEvaluationEndpoints:
         # Mock evaluation ID (would come from a previous evaluation)
         evaluation_id = "test-evaluation-id"
         
-        response = client.get(f"/api/v1/evaluate/results/{evaluation_id}")
+        response = await aclient.get(f"/api/v1/evaluate/results/{evaluation_id}")
         
         # Since endpoint might not exist yet, we expect 404
-        assert response.status_code in [200, 404]
+        assert response.status_code in _OK_OR_NOT_FOUND
 
     @pytest.mark.integration
-    def test_get_evaluation_results_invalid_id(self, client: TestClient):
+    async def test_get_evaluation_results_invalid_id(self, aclient: httpx.AsyncClient):
         """Test retrieving evaluation results with invalid ID."""
-        response = client.get("/api/v1/evaluate/results/invalid-id")
+        response = await aclient.get("/api/v1/evaluate/results/invalid-id")
         
         # Expect 404 for invalid evaluation ID
         assert response.status_code == 404
 
     @pytest.mark.integration
-    @patch('app.services.llm_service.LLMService.evaluate_cv')
-    def test_evaluate_cv_with_custom_criteria(self, mock_evaluate_cv, client: TestClient, sample_pdf_file):
-        """Test CV evaluation with custom evaluation criteria."""
-        mock_response = {
-            "overall_score": 88,
-            "custom_criteria": {
-                "leadership": 85,
-                "innovation": 90,
-                "teamwork": 80
-            }
-        }
-        mock_evaluate_cv.return_value = mock_response
-
-        # Upload CV
-        with open(sample_pdf_file, "rb") as f:
-            upload_response = client.post(
-                "/api/v1/upload/cv",
-                files={"file": ("cv.pdf", f, "application/pdf")}
-            )
-        file_id = upload_response.json()["file_id"]
-
-        # Evaluate with custom criteria
-        evaluation_response = client.post(
-            "/api/v1/evaluate",
-            json={
-                "cv_file_id": file_id,
-                "job_description": "Software Engineer position requiring Python and FastAPI experience with leadership skills"
-            }
-        )
-
-        assert evaluation_response.status_code == 200
-        data = evaluation_response.json()
-        assert "id" in data
-        assert "status" in data
-        assert "message" in data
-
-    @pytest.mark.integration
-    @patch('app.services.llm_service.LLMService.evaluate_cv')
-    def test_evaluate_cv_timeout_handling(self, mock_evaluate_cv, client: TestClient, sample_pdf_file):
+    async def test_evaluate_cv_timeout_handling(self, mock_llm, aclient: httpx.AsyncClient, uploaded_cv_file_id):
         """Test CV evaluation timeout handling."""
-        # Simulate a timeout by making the mock hang
-        async def slow_evaluation(*args, **kwargs):
-            await asyncio.sleep(10)  # Simulate slow response
-            return {"overall_score": 75}
-        
-        mock_evaluate_cv.side_effect = slow_evaluation
+        # Raising TimeoutError immediately exercises the same handler path
+        # as a hung call without leaving a 10s sleep running on the loop
+        mock_llm.side_effect = asyncio.TimeoutError
 
-        # Upload CV
-        with open(sample_pdf_file, "rb") as f:
-            upload_response = client.post(
-                "/api/v1/upload/cv",
-                files={"file": ("cv.pdf", f, "application/pdf")}
-            )
-        file_id = upload_response.json()["file_id"]
+        file_id = uploaded_cv_file_id
 
         # This test would need timeout configuration in the actual endpoint
         # For now, we'll just verify the structure
-        evaluation_response = client.post(
-            "/api/v1/evaluate",
-            json={
+        evaluation_response = await aclient.post(
+            EVALUATE_URL,
+            content=orjson.dumps({
                 "cv_file_id": file_id,
                 "job_description": "Software Engineer position"
-            }
+            }),
+            headers=_JSON_HDR
         )
 
         # The response might timeout or succeed depending on implementation
-        assert evaluation_response.status_code in [200, 408, 500]
\ No newline at end of file
+        assert evaluation_response.status_code in _TIMEOUT_STATUSES
\ No newline at end of file
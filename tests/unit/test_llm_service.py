@@ -1,9 +1,39 @@
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-from app.services.llm_service import LLMService
-from app.models.schemas import LLMProvider, CVEvaluation, ProjectEvaluation
+import orjson
+from unittest.mock import patch
+from app.services.llm_service import LLMService, _extract_first_json
+from app.models.schemas import LLMProvider, CVEvaluation
 from app.core.exceptions import LLMServiceError
 
+# Mock provider responses, serialized once at import with the same orjson
+# the service uses to parse them back
+_OPENAI_CV_JSON = orjson.dumps({
+    "technical_skills_match": 0.85,
+    "experience_level": 0.8,
+    "relevant_achievements": 0.7,
+    "cultural_fit": 0.9,
+    "cv_match_rate": 0.81,
+    "cv_feedback": "Excellent technical skills"
+}).decode()
+
+_GEMINI_CV_JSON = orjson.dumps({
+    "technical_skills_match": 0.75,
+    "experience_level": 0.8,
+    "relevant_achievements": 0.65,
+    "cultural_fit": 0.85,
+    "cv_match_rate": 0.76,
+    "cv_feedback": "Good technical foundation"
+}).decode()
+
+_RETRY_CV_JSON = orjson.dumps({
+    "technical_skills_match": 0.8,
+    "experience_level": 0.75,
+    "relevant_achievements": 0.7,
+    "cultural_fit": 0.85,
+    "cv_match_rate": 0.78,
+    "cv_feedback": "Solid technical background"
+}).decode()
+
 
 class TestLLMService:
     
@@ -11,77 +41,83 @@ class TestLLMService:
     def llm_service(self):
         """Create LLMService instance for testing"""
         return LLMService()
-    
-    def test_init_with_openai_key(self, llm_service):
+
+    @pytest.fixture
+    def llm_env(self, monkeypatch):
+        """Configure provider keys and availability in one call.
+
+        One monkeypatch batch replaces the two-to-three nested
+        unittest.mock.patch context managers each test used to stack;
+        monkeypatch restores everything after the test.
+        """
+        def _set(openai_key=None, gemini_key=None,
+                 openai_available=False, gemini_available=False):
+            monkeypatch.setattr("app.services.llm_service.settings.OPENAI_API_KEY", openai_key)
+            monkeypatch.setattr("app.services.llm_service.settings.GEMINI_API_KEY", gemini_key)
+            monkeypatch.setattr("app.services.llm_service.OPENAI_AVAILABLE", openai_available)
+            monkeypatch.setattr("app.services.llm_service.GEMINI_AVAILABLE", gemini_available)
+        return _set
+    
+    def test_init_with_openai_key(self, llm_env):
         """Test LLMService initialization with OpenAI API key"""
-        with patch('app.services.llm_service.settings.OPENAI_API_KEY', 'test-key'):
-            with patch('app.services.llm_service.settings.GEMINI_API_KEY', None):
-                service = LLMService()
-                assert hasattr(service, 'setup_clients')
+        llm_env(openai_key='test-key')
+        service = LLMService()
+        assert hasattr(service, 'setup_clients')
     
-    def test_init_with_gemini_key(self, llm_service):
+    def test_init_with_gemini_key(self, llm_env):
         """Test LLMService initialization with Gemini API key"""
-        with patch('app.services.llm_service.settings.OPENAI_API_KEY', None):
-            with patch('app.services.llm_service.settings.GEMINI_API_KEY', 'test-key'):
-                service = LLMService()
-                assert hasattr(service, 'setup_clients')
+        llm_env(gemini_key='test-key')
+        service = LLMService()
+        assert hasattr(service, 'setup_clients')
     
-    def test_init_with_no_keys(self, llm_service):
+    def test_init_with_no_keys(self, llm_env):
         """Test LLMService initialization with no API keys"""
-        with patch('app.services.llm_service.settings.OPENAI_API_KEY', None):
-            with patch('app.services.llm_service.settings.GEMINI_API_KEY', None):
-                service = LLMService()
-                assert hasattr(service, 'setup_clients')
+        llm_env()
+        service = LLMService()
+        assert hasattr(service, 'setup_clients')
     
+
+
     @pytest.mark.asyncio
-    async def test_evaluate_cv_with_openai_success(self, llm_service):
-        """Test successful CV evaluation with OpenAI"""
-        # Mock OpenAI response
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = '''
-        {
-            "technical_skills_match": 0.85,
-            "experience_level": 0.8,
-            "relevant_achievements": 0.7,
-            "cultural_fit": 0.9,
-            "cv_match_rate": 0.81,
-            "cv_feedback": "Excellent technical skills"
-        }
-        '''
-        
-        with patch.object(llm_service, '_call_openai', return_value=mock_response.choices[0].message.content):
-            with patch('app.services.llm_service.OPENAI_AVAILABLE', True):
-                with patch('app.services.llm_service.settings.OPENAI_API_KEY', 'test-key'):
-                    result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
-                    
-                    assert isinstance(result, CVEvaluation)
-                    assert result.technical_skills_match == 0.85
-                    assert result.cv_feedback == "Excellent technical skills"
-    
+    @pytest.mark.parametrize("provider, call_method, response, expected_match, expected_feedback", [
+        pytest.param(LLMProvider.OPENAI, '_call_openai', _OPENAI_CV_JSON,
+                     0.85, "Excellent technical skills", id="openai"),
+        pytest.param(LLMProvider.GEMINI, '_call_gemini', _GEMINI_CV_JSON,
+                     0.75, "Good technical foundation", id="gemini"),
+    ])
+    async def test_evaluate_cv_provider_success(self, llm_service, llm_env, provider,
+                                                call_method, response,
+                                                expected_match, expected_feedback):
+        """Test successful CV evaluation per provider"""
+        llm_env(openai_key='test-key', gemini_key='test-key',
+                openai_available=True, gemini_available=True)
+        with patch.object(llm_service, call_method, return_value=response):
+            result = await llm_service.evaluate_cv("CV text", "Job requirements", provider)
+
+            assert isinstance(result, CVEvaluation)
+            assert result.technical_skills_match == expected_match
+            assert result.cv_feedback == expected_feedback
+
     @pytest.mark.asyncio
-    async def test_evaluate_cv_with_gemini_success(self, llm_service):
-        """Test successful CV evaluation with Gemini"""
-        mock_response = '''
-        {
-            "technical_skills_match": 0.75,
-            "experience_level": 0.8,
-            "relevant_achievements": 0.65,
-            "cultural_fit": 0.85,
-            "cv_match_rate": 0.76,
-            "cv_feedback": "Good technical foundation"
-        }
-        '''
-        
-        with patch.object(llm_service, '_call_gemini', return_value=mock_response):
-            with patch('app.services.llm_service.GEMINI_AVAILABLE', True):
-                with patch('app.services.llm_service.settings.GEMINI_API_KEY', 'test-key'):
-                    result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.GEMINI)
-                    
-                    assert isinstance(result, CVEvaluation)
-                    assert result.technical_skills_match == 0.75
-                    assert result.cv_feedback == "Good technical foundation"
-    
+    @pytest.mark.parametrize("provider, call_method, behavior", [
+        pytest.param(LLMProvider.OPENAI, '_call_openai',
+                     {"side_effect": LLMServiceError("API Error")}, id="openai-error"),
+        pytest.param(LLMProvider.GEMINI, '_call_gemini',
+                     {"side_effect": LLMServiceError("API Error")}, id="gemini-error"),
+        pytest.param(LLMProvider.OPENAI, '_call_openai',
+                     {"return_value": "Invalid JSON response"}, id="invalid-json"),
+    ])
+    async def test_evaluate_cv_provider_failure_falls_back(self, llm_service, llm_env,
+                                                           provider, call_method, behavior):
+        """API errors and junk responses both fall back to mock data"""
+        llm_env(openai_key='test-key', gemini_key='test-key',
+                openai_available=True, gemini_available=True)
+        with patch.object(llm_service, call_method, **behavior):
+            result = await llm_service.evaluate_cv("CV text", "Job requirements", provider)
+
+            assert isinstance(result, CVEvaluation)
+            assert result.technical_skills_match == 0.82
+
     @pytest.mark.asyncio
     async def test_evaluate_cv_with_mock_provider(self, llm_service):
         """Test CV evaluation with mock provider"""
@@ -91,64 +127,29 @@ class TestLLMService:
         assert result.technical_skills_match == 0.82
         assert result.cv_feedback == "Strong in backend and cloud, limited AI integration experience."
     
+
+
+
     @pytest.mark.asyncio
-    async def test_evaluate_cv_openai_api_error(self, llm_service):
-        """Test CV evaluation with OpenAI API error"""
-        with patch.object(llm_service, '_call_openai', side_effect=LLMServiceError("API Error")):
-            with patch('app.services.llm_service.OPENAI_AVAILABLE', True):
-                with patch('app.services.llm_service.settings.OPENAI_API_KEY', 'test-key'):
-                    result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
-                    
-                    # Should fallback to mock data
-                    assert isinstance(result, CVEvaluation)
-                    assert result.technical_skills_match == 0.82
-    
-    @pytest.mark.asyncio
-    async def test_evaluate_cv_gemini_api_error(self, llm_service):
-        """Test CV evaluation with Gemini API error"""
-        with patch.object(llm_service, '_call_gemini', side_effect=LLMServiceError("API Error")):
-            with patch('app.services.llm_service.GEMINI_AVAILABLE', True):
-                with patch('app.services.llm_service.settings.GEMINI_API_KEY', 'test-key'):
-                    result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.GEMINI)
-                    
-                    # Should fallback to mock data
-                    assert isinstance(result, CVEvaluation)
-                    assert result.technical_skills_match == 0.82
-    
-    @pytest.mark.asyncio
-    async def test_evaluate_cv_invalid_json_response(self, llm_service):
-        """Test CV evaluation with invalid JSON response"""
-        with patch.object(llm_service, '_call_openai', return_value="Invalid JSON response"):
-            with patch('app.services.llm_service.OPENAI_AVAILABLE', True):
-                with patch('app.services.llm_service.settings.OPENAI_API_KEY', 'test-key'):
-                    result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
-                    
-                    # Should fallback to mock data
-                    assert isinstance(result, CVEvaluation)
-                    assert result.technical_skills_match == 0.82
-    
-    @pytest.mark.asyncio
-    async def test_evaluate_cv_no_provider_available(self, llm_service):
+    async def test_evaluate_cv_no_provider_available(self, llm_service, llm_env):
         """Test CV evaluation when no provider is available"""
-        with patch('app.services.llm_service.OPENAI_AVAILABLE', False):
-            with patch('app.services.llm_service.GEMINI_AVAILABLE', False):
-                result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
-                
-                # Should fallback to mock data
-                assert isinstance(result, CVEvaluation)
-                assert result.technical_skills_match == 0.82
+        llm_env()
+        result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
+
+        # Should fallback to mock data
+        assert isinstance(result, CVEvaluation)
+        assert result.technical_skills_match == 0.82
     
     @pytest.mark.asyncio
-    async def test_evaluate_cv_fallback_to_mock(self, llm_service):
+    async def test_evaluate_cv_fallback_to_mock(self, llm_service, llm_env):
         """Test CV evaluation fallback to mock when no API keys"""
-        with patch('app.services.llm_service.settings.OPENAI_API_KEY', None):
-            with patch('app.services.llm_service.settings.GEMINI_API_KEY', None):
-                result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
-                
-                # Should use mock data
-                assert isinstance(result, CVEvaluation)
-                assert result.technical_skills_match == 0.82
-                assert result.cv_feedback == "Strong in backend and cloud, limited AI integration experience."
+        llm_env()
+        result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
+
+        # Should use mock data
+        assert isinstance(result, CVEvaluation)
+        assert result.technical_skills_match == 0.82
+        assert result.cv_feedback == "Strong in backend and cloud, limited AI integration experience."
     
     def test_create_cv_prompt(self, llm_service):
         """Test CV evaluation prompt creation"""
@@ -163,28 +164,16 @@ class TestLLMService:
         assert "cv_match_rate" in prompt
     
     @pytest.mark.asyncio
-    async def test_evaluate_cv_with_retry_mechanism(self, llm_service):
+    async def test_evaluate_cv_with_retry_mechanism(self, llm_service, llm_env):
         """Test CV evaluation with retry mechanism"""
         # Mock first call fails, second succeeds
-        mock_response = '''
-        {
-            "technical_skills_match": 0.8,
-            "experience_level": 0.75,
-            "relevant_achievements": 0.7,
-            "cultural_fit": 0.85,
-            "cv_match_rate": 0.78,
-            "cv_feedback": "Solid technical background"
-        }
-        '''
-        
-        with patch.object(llm_service, '_call_openai', side_effect=[LLMServiceError("Temporary error"), mock_response]):
-            with patch('app.services.llm_service.OPENAI_AVAILABLE', True):
-                with patch('app.services.llm_service.settings.OPENAI_API_KEY', 'test-key'):
-                    result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
-                    
-                    # Should fallback to mock on retry failure
-                    assert isinstance(result, CVEvaluation)
-                    assert result.technical_skills_match == 0.82
+        llm_env(openai_key='test-key', openai_available=True)
+        with patch.object(llm_service, '_call_openai', side_effect=[LLMServiceError("Temporary error"), _RETRY_CV_JSON]):
+            result = await llm_service.evaluate_cv("CV text", "Job requirements", LLMProvider.OPENAI)
+
+            # Should fallback to mock on retry failure
+            assert isinstance(result, CVEvaluation)
+            assert result.technical_skills_match == 0.82
     
     @pytest.mark.asyncio
     async def test_evaluate_cv_empty_inputs(self, llm_service):
@@ -203,4 +192,29 @@ class TestLLMService:
         
         assert isinstance(result, CVEvaluation)
         assert result.technical_skills_match == 0.82
-        assert result.cv_feedback == "Strong in backend and cloud, limited AI integration experience."
\ No newline at end of file
+        assert result.cv_feedback == "Strong in backend and cloud, limited AI integration experience."
+
+class TestExtractFirstJson:
+    """Tests for the single-pass JSON extraction scanner"""
+
+    def test_extract_from_markdown_fence(self):
+        response = 'Here is the result:\n```json\n{"score": 0.9, "note": "ok"}\n```\nThanks!'
+        assert _extract_first_json(response) == '{"score": 0.9, "note": "ok"}'
+
+    def test_extract_first_of_two_objects(self):
+        response = '{"first": 1} some commentary {"second": 2}'
+        assert _extract_first_json(response) == '{"first": 1}'
+
+    def test_braces_inside_strings_ignored(self):
+        response = 'prefix {"text": "uses } and { freely", "n": 1} suffix'
+        assert _extract_first_json(response) == '{"text": "uses } and { freely", "n": 1}'
+
+    def test_nested_objects_kept_whole(self):
+        response = '{"outer": {"inner": {"deep": true}}} trailing'
+        assert _extract_first_json(response) == '{"outer": {"inner": {"deep": true}}}'
+
+    def test_no_json_returns_none(self):
+        assert _extract_first_json("no json here") is None
+
+    def test_unterminated_object_returns_none(self):
+        assert _extract_first_json('{"never": "closed"') is None